@@ -32,6 +32,8 @@ class Token:
         LPAREN = auto()
         RPAREN = auto()
 
+    __slots__ = ('type', 'text') # one instance per token of the input, so no '__dict__' for each of them
+
     def __init__(self, type, text):
         self.type = type
         self.text = text
@@ -63,7 +65,8 @@ def lex(input):
                     digits.append(input[j])
                     i += 1 # increment index of the while loop as well, as long as successive digits are encountered
                 else:
-                    result.append(Token(Token.Type.INTEGER, ''.join(digits)))
+                    # the digits are turned into an integer right here, so the parser doesn't have to
+                    result.append(Token(Token.Type.INTEGER, int(''.join(digits))))
                     break
         i += 1 # increment the while loop index as the index is not incremented when a non-digit character is encountered
     return result # list of tokens is returned
@@ -103,7 +106,7 @@ def parse(tokens):
     while(i < len(tokens)):
         token = tokens[i]
         if token.type == Token.Type.INTEGER:
-            integer = Integer(int(token.text))
+            integer = Integer(token.text) # the text of an INTEGER token is already an integer
             if not have_lhs: # If the LHS of the expression is not yet complete
                 result.left = integer
                 have_lhs = True
@@ -167,63 +170,80 @@ if __name__ == '__main__':
 #     evaluator returns 0 (zero)
 #   * In case of any parsing failure, evaluator returns 0
 
-from enum import Enum
+import re
+
+# integers, operators and (variable) names - every other character is part of a name
+_TOKEN_RE = re.compile(r'(\d+)|([+\-])|([^\d+\-]+)')
+_EXPRESSION_RE = re.compile(r'(?:\d+|[^\d+\-]+)(?:[+\-](?:\d+|[^\d+\-]+))*')
 
-class Token:
-    class Type(Enum):
-        INTEGER = 0
-        PLUS = 1 
-        MINUS = 2
-    def __init__(self, text, token_type):
-        self.text = text
-        self.token_type = token_type
-    def __str__(self):
-        return '`{}`'.format(self.text)
-        
 class ExpressionProcessor:
     def __init__(self):
         self.variables = {}
 
     def calculate(self, expression):
+        # A valid expression is an integer or a name, followed by any number of operators that are each followed
+        # by an integer or a name. Anything else is a parsing failure.
+        if not _EXPRESSION_RE.fullmatch(expression):
+            return 0
+        # Lexing: a single regular expression splits the whole expression into integers, operators and names
+        # (the regular expression engine goes through the string in C, instead of a Python loop going through
+        # every character).
+        # The tokens are not objects of a class: an integer is stored as a plain 'int' and an operator as its
+        # (one character) string, so no object has to be created for every token.
         tokens = []
-        i = 0
-        while (i < len(expression)):
-            if expression[i] == '+':
-                tokens.append(Token('+', Token.Type.PLUS))
-            elif expression[i] == '-':
-                tokens.append(Token('-', Token.Type.MINUS))
-            elif expression[i].isdigit():
-                digits = [expression[i]]
-                for j in range(i+1, len(expression)):
-                    if expression[j].isdigit():
-                        digits.append(expression[j])
-                    else:
-                        i = j - 1
-                        tokens.append(Token(''.join(digits), Token.Type.INTEGER))
-                        break
+        for m in _TOKEN_RE.finditer(expression):
+            digits, op, name = m.groups()
+            if digits is not None:
+                tokens.append(int(digits))
+            elif op is not None:
+                tokens.append(op)
             else:
-                name = [expression[i]]
-                for j in range(i+1, len(expression)):
-                    if (expression[j] not in ['+', '-']) and (not expression[j].isdigit()):
-                        name.append(expression[j])
-                    else:
-                        i = j - 1
-                        if not ''.join(name) in self.variables:
-                            return 0
-                        else:
-                            tokens.append(Token(self.variables[''.join(name)], Token.Type.INTEGER))
-                        break
-            
-            i += 1
-        value = int(tokens[0].text)
+                if len(name) != 1 or name not in self.variables:
+                    return 0
+                tokens.append(self.variables[name])
+        # the validation above guarantees that the tokens alternate between integers and operators, starting
+        # and ending with an integer
+        value = tokens[0]
         i = 1
         while(i < len(tokens)):
-            if tokens[i].Type == Token.Type.PLUS:
-                value += int(tokens[i+1].text)
-            elif tokens[i].Type == Token.Type.MINUS:
-                value -= int(tokens[i+1].text)
+            op = tokens[i]
+            rhs = tokens[i+1]
+            value = value + rhs if op == '+' else value - rhs
             i += 2
         return value
+
+
+# TESTS
+
+import unittest
+
+class ExpressionProcessorTest(unittest.TestCase):
+    # the processor is bound here, when the class is defined: the alternative approach below defines another
+    # 'ExpressionProcessor' and runs the same tests on it
+    processor_class = ExpressionProcessor
+
+    def setUp(self):
+        self.ep = self.processor_class()
+        self.ep.variables['x'] = 5
+
+    def test_integers(self):
+        self.assertEqual(1, self.ep.calculate('1'))
+        self.assertEqual(3, self.ep.calculate('1+2'))
+        self.assertEqual(-8, self.ep.calculate('12-20'))
+
+    def test_variables(self):
+        self.assertEqual(6, self.ep.calculate('1+x'))
+        self.assertEqual(0, self.ep.calculate('1+y')) # not in 'variables'
+        self.assertEqual(0, self.ep.calculate('1+xy')) # more than one letter
+
+    def test_long_expression(self):
+        self.assertEqual(1000, self.ep.calculate('+'.join(['1'] * 1000)))
+        self.assertEqual(-998, self.ep.calculate('-'.join(['1'] * 1000)))
+
+    def test_parsing_failure(self):
+        self.assertEqual(0, self.ep.calculate('1+'))
+        self.assertEqual(0, self.ep.calculate('1++2'))
+        self.assertEqual(0, self.ep.calculate(''))
     
 
 
@@ -231,24 +251,24 @@ class ExpressionProcessor:
 # ALTERNATIVE APPROACH TO EXERCISE
 
 import re
+import operator
 from enum import Enum
 
-# Use a custom method to split the expression by 
-def megasplit(pattern, string):
-    # 'list((m.start(), m.end()) for m in re.finditer("(?<=[+-])", "1+23+456"))' will return:
-    # [(2, 2), (5, 5)]
-    splits = list((m.start(), m.end()) for m in re.finditer(pattern, string))
-    starts = [0] + [i[1] for i in splits] # [0, 2, 5]
-    ends = [i[0] for i in splits] + [len(string)] # [2, 5, 8]
-    return [string[start:end] for start, end in zip(starts, ends)] # ['1+', '23+', '456']
-    # Note that the operator itself is added as the last character because starts and ends contain
-    # the "(?<=[+-])" pattern will return the start and end indices of the character before which there
-    # was a match for [+-]
+# The regular expressions are compiled once, when the module is loaded, instead of being looked up in the
+# cache of the 're' module on every call
+_LOOKBEHIND = re.compile('(?<=[+-])')
+# every part of the expression is an operand, optionally followed by an operator
+_PART = re.compile('([^+\\-]*)([+\\-]?)')
 
 class ExpressionProcessor:
     class NextOp(Enum):
         PLUS = 1
         MINUS = 2
+    # the operator at the end of a part gives the operation to apply with the next part
+    _NEXT_OP = {'+': NextOp.PLUS, '-': NextOp.MINUS, '': None}
+    # the function that combines the 'current' result with the value of the next part, for every 'next_op'
+    # (before the first operator, the 'current' result is simply the value of the first part)
+    _APPLY = {None: lambda current, value: value, NextOp.PLUS: operator.add, NextOp.MINUS: operator.sub}
 
     def __init__(self):
         self.variables = {}
@@ -257,47 +277,54 @@ class ExpressionProcessor:
         current = 0
         next_op = None
 
-        # doesn't work in python 3.5
-        # parts = re.split('(?<=[+-])', expression)
         # The look-behind assertion '(?<=...)' matches if the current position in the string is preceded by 
         # a match for '...' that ends at the current position. 
         # For Example: re.finditer("(?<=[+-])", "1+23+456")) will return [(2, 2), (5, 5)] which are the positions
         # of the characters before which [+-] characters occur in the expression string. The 're.finditer()'
         # method returns match objects with start and end positions of the match which will be a same in this
         # case because only a single character will this pattern.
-        parts = megasplit('(?<=[+-])', expression) # ['1+', '23+', '456']
+        # Splitting at these (empty) matches keeps the operator as the last character of every part. Splitting
+        # on empty matches is supported by 're.split()' since python 3.7 (it doesn't work in python 3.5), and it
+        # does the whole split in a single call.
+        parts = _LOOKBEHIND.split(expression) # ['1+', '23+', '456']
 
         for part in parts:
-            # split each element by the operator and extract just the integer (first element) part
-            noop = re.split('[\+\-]', part)
-            first = noop[0]
+            # match each element to get the integer (first group) and the operator at its end (second group)
+            first, op = _PART.match(part).groups()
             value = 0
 
             try:
                 value = int(first) # try converting to int
             except ValueError: # upon error in integer conversion, check if it is a key in 'self.variables'
                 # also perform check on the length of the key to return zero if key length > 1
-                if len(first) == 1 and first[0] in self.variables:
-                    value = self.variables[first[0]]
-                else:
+                # (a single dictionary lookup both checks for the key and gets its value)
+                if len(first) != 1:
+                    return 0
+                value = self.variables.get(first)
+                if value is None:
                     return 0
 
             # According to the 'next_op' character, modify the 'current' result accumulator variable
-            if not next_op:
-                current = value
-            elif next_op == self.NextOp.PLUS:
-                current += value
-            elif next_op == self.NextOp.MINUS:
-                current -= value
-
-            # Update the 'next_op' according to the end character in current 'part'
-            if part.endswith('+'):
-                next_op = self.NextOp.PLUS
-            elif part.endswith('-'):
-                next_op = self.NextOp.MINUS
-            # for the last element in 'parts', there will be no operator character at the end.
-            # we take care of this edge case here!
-            else:
-                next_op = None
+            current = self._APPLY[next_op](current, value)
+
+            # Update the 'next_op' according to the operator at the end of the current 'part'
+            # for the last element in 'parts', there will be no operator character at the end ('' is
+            # mapped to None)
+            next_op = self._NEXT_OP[op]
+
+        return current # return the final evaluation of the expression
 
-        return current # return the final evaluation of the expression
\ No newline at end of file
+
+
+class AlternativeExpressionProcessorTest(ExpressionProcessorTest):
+    processor_class = ExpressionProcessor
+
+
+class LexerParserTest(unittest.TestCase):
+    def test_calc(self):
+        self.assertEqual(4, parse(lex('(13+4)-(12+1)')).value)
+        self.assertEqual(19, parse(lex('(20-3)+(1+1)')).value)
+
+
+if __name__ == '__main__':
+    unittest.main()
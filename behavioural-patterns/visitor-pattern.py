@@ -192,35 +192,82 @@ def visitor(arg_type):
     return decorator
 
 
-# ↑↑↑ LIBRARY CODE ↑↑↑
+# A class decorator that specializes the 'visit()' method of a finished Visitor class. Once all the
+# overloaded 'visit()' methods have been registered in '_methods', we generate (at class-definition
+# time) the source code of a single straight-line 'visit()' that checks the argument type with 'is'
+# and calls the matching handler directly. Every type, handler and helper is bound as a default
+# argument (a fast local variable), so the generated method does not have to build a '_qualname()'
+# string or look up anything in the global namespace on every call.
+# An argument whose exact type has no handler (like a sub-class of one of the visited types) is passed
+# on to the handler of the nearest base class in its MRO (Method Resolution Order).
+def finalize_visitor(cls):
+    """Class decorator that replaces the delegating visit() with a generated one."""
+    owner = _qualname(cls)
+    handlers = [(arg_type, fn) for (declaring_class, arg_type), fn in _methods.items()
+                if declaring_class == owner]
+    table = dict(handlers)
+    def by_mro(self, arg, k):
+        for base in k.__mro__:
+            fn = table.get(base)
+            if fn is not None:
+                return fn(self, arg)
+        raise TypeError(k)
+    namespace = {'_t': type, '_mro': by_mro}
+    params = ['self', 'arg', '_t=_t']
+    body = ['    k = _t(arg)']
+    for i, (arg_type, fn) in enumerate(handlers):
+        namespace[f'_k{i}'] = arg_type
+        namespace[f'_h{i}'] = fn
+        params.append(f'_k{i}=_k{i}')
+        params.append(f'_h{i}=_h{i}')
+        body.append(f'    if k is _k{i}: return _h{i}(self, arg)')
+    params.append('_mro=_mro')
+    body.append('    return _mro(self, arg, k)')
+    source = 'def visit({}):\n{}\n'.format(', '.join(params), '\n'.join(body))
+    # e.g. for 'ExpressionPrinter':
+    # def visit(self, arg, _t=_t, _k0=_k0, _h0=_h0, _k1=_k1, _h1=_h1, _mro=_mro):
+    #     k = _t(arg)
+    #     if k is _k0: return _h0(self, arg)
+    #     if k is _k1: return _h1(self, arg)
+    #     return _mro(self, arg, k)
+    exec(source, namespace)
+    cls.visit = namespace['visit']
+    return cls
+
 
+# ↑↑↑ LIBRARY CODE ↑↑↑
 
 
 
 class DoubleExpression:
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
     def accept(self, visitor): # double-dispatch
-        visitor.visit(self)
+        return visitor.visit(self)
 
 
 class AdditionExpression:
+    __slots__ = ('left', 'right')
     def __init__(self, left, right):
         self.right = right
         self.left = left
     def accept(self, visitor): # double-dispatch
-        visitor.visit(self)
+        return visitor.visit(self)
 
 
 class SubtractionExpression:
+    __slots__ = ('left', 'right')
     def __init__(self, left, right):
         self.right = right
         self.left = left
     def accept(self, visitor): # double-dispatch
-        visitor.visit(self)
+        return visitor.visit(self)
 
 
+@finalize_visitor
 class ExpressionPrinter:
+    __slots__ = ('buffer',) # fixed attribute layout, cheap to create one Visitor per batch/thread
     def __init__(self):
         self.buffer = []
     def __str__(self):
@@ -243,18 +290,16 @@ class ExpressionPrinter:
         self.buffer.append(')')
 
 # Another Visitor Class
+@finalize_visitor
 class ExpressionEvaluator:
-    def __init__(self):
-        self.value = None
+    __slots__ = () # stateless: every 'visit()' returns its result instead of storing it in 'self.value'
     @visitor(DoubleExpression)
     def visit(self, de):
-        self.value = de.value
+        return de.value
     @visitor(AdditionExpression)
     def visit(self, ae):
-        self.visit(ae.left)
-        temp = self.value # cache the value after visiting part of the expression (stateful Visitor)
-        self.visit(ae.right)
-        self.value += temp
+        # no need to cache the left result in a temporary, the Visitor just returns values
+        return self.visit(ae.left) + self.visit(ae.right)
 
 if __name__ == '__main__':
     # '1 + (2 + 3)' will be abstracted as a recursive data structure
@@ -262,8 +307,7 @@ if __name__ == '__main__':
     printer = ExpressionPrinter()
     printer.visit(e)
     evaluator = ExpressionEvaluator()
-    evaluator.visit(e)
-    print(f'{printer} = {evaluator.value}')
+    print(f'{printer} = {evaluator.visit(e)}')
 
 
 
@@ -28,7 +28,7 @@
 # FACTORY METHOD IMPLEMENTATION
 
 from enum import Enum
-from math import *  # for sin() and cos() functions
+from math import sin, cos
 
 # For every coordinate system, we have to add a new enum member and add another check in the
 # class constructor below.
@@ -40,7 +40,18 @@ class CoordinateSystem(Enum):
     POLAR = 2
 
 
+# Shared conversion used by all the polar Factory methods below: 'cos()' and 'sin()' of the angle are
+# each computed exactly once, in one place. They are bound as default arguments so that they are read
+# as fast local variables instead of being looked up in the module globals on every call.
+def _polar_to_cartesian(rho, theta, _sin=sin, _cos=cos):
+    c = _cos(theta)
+    s = _sin(theta)
+    return rho * c, rho * s
+
+
 class Point:
+    __slots__ = ('x', 'y') # no per-instance '__dict__', points are small and created in bulk
+
     # Initializing a cartesian system point or a polar coordinate point.
     # Here, we have to figure out a way to map the arguments 'a' and 'b' to
     # the coordinates of a point in the system, which is another problem!
@@ -68,7 +79,7 @@ class Point:
     # Factory method to create a point in the Polar coordinate system
     @staticmethod
     def new_polar_point(rho, theta):
-        return Point(rho * cos(theta), rho * sin(theta))
+        return Point(*_polar_to_cartesian(rho, theta))
 
     # Factory Class Implemented inside the main Class itself!
     # The methods of this Factory class can be accessed using 'Point.PointFactory.new_polar_point()'
@@ -86,11 +97,16 @@ class Point:
             return p
 
         def new_polar_point(self, rho, theta):
-            return Point(rho * cos(theta), rho * sin(theta))
+            return Point(*_polar_to_cartesian(rho, theta))
     # If you need to create a PointFactory instance with non-static attributes, you can create it
     # like so:
     # factory = PointFactory(<args>) and then used its methods like 'Point.factory.new_polar_point()'
 
+# Module-level aliases of the Factory methods. Callers can use 'new_polar_point(1, 2)' directly
+# instead of going through the class every time ('Point.new_polar_point(1, 2)').
+new_cartesian_point = Point.new_cartesian_point
+new_polar_point = Point.new_polar_point
+
 # FACTORY (CLASS) IMPLEMENATION
 
 # One problem with such Factory classes is that their presence can sometimes go unnoticed by clients!
@@ -110,13 +126,21 @@ class PointFactory:
     # Factory method to create a point in the Polar coordinate system
     @staticmethod
     def new_polar_point(rho, theta):
-        return Point(rho * cos(theta), rho * sin(theta))
+        return Point(*_polar_to_cartesian(rho, theta))
+
+    # Batch Factory method to create many points in the Polar coordinate system at once.
+    # The conversion is inlined into a single list comprehension, so we do not pay for an extra
+    # function call (and tuple unpacking) per point.
+    @staticmethod
+    def new_polar_points(rhos, thetas, _sin=sin, _cos=cos):
+        return [Point(rho * _cos(theta), rho * _sin(theta)) for rho, theta in zip(rhos, thetas)]
 
 
 # if __name__ == '__main__':
 #     p = Point(2, 3)
 #     p2 = Point.new_polar_point(1, 2)
 #     p2 = Point.PointFactory.new_polar_point(1, 2)
+#     p2 = new_polar_point(1, 2)
 #     print(p, p2)
 
 
@@ -132,6 +156,14 @@ class HotDrink(ABC):
         pass
 # An Abstract Factory Class
 class HotDrinkFactory(ABC):
+    # Registry of all the concrete Factory classes, keyed by the name of the drink they prepare
+    _registry = {}
+    # '__init_subclass__()' is called whenever a class inheriting from 'HotDrinkFactory' is defined.
+    # Factories that pass a 'drink' keyword in their class definition register themselves here.
+    def __init_subclass__(cls, drink=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if drink:
+            HotDrinkFactory._registry[drink] = cls
     # An abstract Factory method (unimplemented method) that is supposed to return an Object
     def prepare(self):
         pass
@@ -145,26 +177,33 @@ class Coffee(HotDrink):
         print('This coffee is delicious')
 
 
-class TeaFactory(HotDrinkFactory):
+class TeaFactory(HotDrinkFactory, drink='Tea'):
     def prepare(self, amount):
         print(f'Put in tea bag, boil water,',
               f'pour {amount}ml, enjoy!')
         return Tea()
     
-class CoffeeFactory(HotDrinkFactory):
+class CoffeeFactory(HotDrinkFactory, drink='Coffee'):
     def prepare(self, amount):
         print(f'Grind some beans, boil water,',
               f'pour {amount}ml, enjoy!')
         return Coffee()
 
+# The Factories hold no state, so a single instance of each can be re-used for every drink
+_TEA = TeaFactory()
+_COFFEE = CoffeeFactory()
+
+# Each drink type is mapped to its Factory and amount, so picking one is a single dictionary lookup
+# instead of a chain of 'if/elif' comparisons that grows with every new drink
+_DISPATCH = {
+    'tea': (_TEA, 200),
+    'coffee': (_COFFEE, 50)
+}
+
 # A function using the Factory methods corresponding to an user input
 def make_drink(type):
-    if type == 'tea':
-        return TeaFactory().prepare(200)
-    elif type == 'coffee':
-        return CoffeeFactory().prepare(50)
-    else:
-        return None
+    factory, amount = _DISPATCH.get(type, (None, None))
+    return factory.prepare(amount) if factory else None
 
 
 # if __name__ == '__main__':
@@ -178,45 +217,42 @@ def make_drink(type):
 
 # ANOTHER APPROACH IS TO USE A COLLECTION OF FACTORIES
 
-import sys
-from enum import auto # auto() automatically assigns the integer values to Enum members starting from 1
-current_module = sys.modules[__name__] # Get a reference to the current python module file for getting the
-# classes implemented in it
-
 class HotDrinkMachine:
-    # An enumerator class holding all the available drinks
-    class AvailableDrink(Enum): # Violates the Open-Closed Principle!
-        # auto() automatically assigns the integer values to Enum members starting from 1
-        COFFEE = auto()
-        TEA = auto()
-    # Python is dynamically typed (performs duck-typing), so, even if the factory methods implemented
-    # above such as 'TeaFactory' and 'CoffeeFactory' donot inherit from the abstract Factory class
-    # 'HotDrinkFactory', we can still append their instances to this 'self.factories' collection (list)
-    factories = [] # collection of Factory classes
-    initialized = False # Is the Factory collection initialized ?
-    def __init__(self):
-        if not self.initialized:
-            for d in self.AvailableDrink:
-                name = d.name[0] + d.name[1:].lower()
-                # Factory class name
-                factory_name = name + 'Factory'
-                # Use the Factory class name to create an instance of it from the current module file 
-                factory_instance = getattr(current_module, factory_name)()
-                self.factories.append((name, factory_instance))
-            self.initialized = True
+    # We could keep an Enum of all the available drinks and find the Factory class of each by its name
+    # in the current module (using 'getattr(sys.modules[__name__], name + "Factory")'), but such a
+    # reflective lookup is slow, silently depends on the naming of the classes and the Enum has to be
+    # modified for every new drink (violating the Open-Closed Principle!).
+    # Instead, every Factory registers itself in 'HotDrinkFactory._registry' when it is defined, so
+    # a new drink only needs a new Factory class.
+    # The collection is built only once, when the class is defined, and is shared by all the
+    # 'HotDrinkMachine' instances. It is a tuple, so it cannot be modified by accident.
+    factories = tuple((name, cls()) for name, cls in HotDrinkFactory._registry.items())
     
+    def __init__(self):
+        self._last = None # the (factory, amount) of the last drink made, offered as the default choice
+
     # A Factory method that organizes everything together
     def make_drink(self):
+        factories = self.factories
         print('Available drinks: ')
-        for f in self.factories:
+        for f in factories:
             print(f[0])
         
-        s = input(f'Please pick drink (0-{len(self.factories) - 1}): ')
+        if self._last:
+            # Users often order the same drink again, so an empty answer repeats the last order
+            s = input(f'Please pick drink (0-{len(factories) - 1}, Enter to repeat the last drink): ')
+            if not s:
+                factory, amount = self._last
+                return factory.prepare(amount)
+        else:
+            s = input(f'Please pick drink (0-{len(factories) - 1}): ')
         idx = int(s)
         s = input(f'Specify amount: ')
         amount = int(s)
         print(amount)
-        return self.factories[idx][1].prepare(amount)
+        factory = factories[idx][1]
+        self._last = (factory, amount)
+        return factory.prepare(amount)
 
 
 if __name__ == '__main__':
@@ -234,15 +270,19 @@ if __name__ == '__main__':
 # So, the first person the factory makes should have id=0, second id=1 and so on.
 
 class Person:
+    __slots__ = ('id', 'name')
     def __init__(self, id, name):
         self.id = id
         self.name = name
 
+from itertools import count
+
 class PersonFactory:
-    id = 0 # class attribute
+    # A single counter yielding 0, 1, 2, ... kept as a class attribute, so it is shared by all the
+    # 'PersonFactory' instances (it can be reset with 'PersonFactory.ids = count()')
+    ids = count()
     def create_person(self, name):
-        p = Person(PersonFactory.id, name)
-        # The class attribute 'id' is used in creating a new instance because different Factory instances
-        # will share the same class attribute and its state is preserved in the class!
-        PersonFactory.id += 1
-        return p
\ No newline at end of file
+        # The shared counter is used in creating a new instance because different Factory instances
+        # must not hand out the same 'id'. 'next()' increments it in C, without writing to a class
+        # attribute on every call!
+        return Person(next(PersonFactory.ids), name)
\ No newline at end of file
@@ -12,9 +12,12 @@
 # API for customizing and using Prototypes (create customized clones)!
 
 import copy  # for deep-copying objects
+import sys  # for interning strings
 
 
 class Address:
+    __slots__ = ('street_address', 'city', 'country')
+
     def __init__(self, street_address, city, country):
         self.street_address = street_address
         self.city = city
@@ -25,6 +28,8 @@ class Address:
 
 
 class Person:
+    __slots__ = ('name', 'address')
+
     def __init__(self, name, address):
         self.name = name
         self.address = address
@@ -33,30 +38,31 @@ class Person:
         return f'{self.name} lives at {self.address}'
 
 
-address = Address('123 London Road', 'London', 'UK')
-# A Prototype
-john = Person('John', address)
-print(john)
-# Unfortunately here, 'john' and 'jane' refer to the same object (this is not a deep copy)
-# jane = john
-# jane.name = 'Jane'
-# We can try to fix this by doing something like this:
-# But this too has repercussions like below (any change in the 'address' of 'jane' is reflected in 'john'):
-# jane = Person('Jane', address)
-# jane.address.street_address = '123B London Road'
-
-# Perform a shallow-copy causes any reference to another object to be copied over as a reference
-# Thus, the following shallow-copy will lead to carry-over effect on the 'address' object since it
-# is referenced in the 'john' object and the same reference is copied over to the 'jane' object
-# jane = copy.copy(john)
-# Performing a Deep-copy of a Prototype object
-jane = copy.deepcopy(john)
-jane.name = 'Jane'
-jane.address.street_address = '124 London Road'
-print("---")
-# Due to lack of deep-copy, the change in 'jane' is actually a change in 'john' as well
-print(john)
-print(jane)
+if __name__ == '__main__':
+    address = Address('123 London Road', 'London', 'UK')
+    # A Prototype
+    john = Person('John', address)
+    print(john)
+    # Unfortunately here, 'john' and 'jane' refer to the same object (this is not a deep copy)
+    # jane = john
+    # jane.name = 'Jane'
+    # We can try to fix this by doing something like this:
+    # But this too has repercussions like below (any change in the 'address' of 'jane' is reflected in 'john'):
+    # jane = Person('Jane', address)
+    # jane.address.street_address = '123B London Road'
+
+    # Perform a shallow-copy causes any reference to another object to be copied over as a reference
+    # Thus, the following shallow-copy will lead to carry-over effect on the 'address' object since it
+    # is referenced in the 'john' object and the same reference is copied over to the 'jane' object
+    # jane = copy.copy(john)
+    # Performing a Deep-copy of a Prototype object
+    jane = copy.deepcopy(john)
+    jane.name = 'Jane'
+    jane.address.street_address = '124 London Road'
+    print("---")
+    # Due to lack of deep-copy, the change in 'jane' is actually a change in 'john' as well
+    print(john)
+    print(jane)
 
 
 # PROTOTYPE FACTORY
@@ -67,40 +73,74 @@ print(jane)
 
 
 class OfficialAddress:
+    __slots__ = ('street_address', 'city', 'suite')
+
     def __init__(self, street_address, city, suite):
         self.street_address = street_address
         self.city = city
         self.suite = suite
     
+    # 'copy.deepcopy()' calls this method (if it is defined) instead of its generic, reflection based
+    # copying machinery. All the attributes are immutable values, so we can just pass them on.
+    # The copy is recorded in 'memo', so an address that appears several times in the copied structure
+    # is copied only once (and all the copies share it, just like the originals do).
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = type(self)(self.street_address, self.city, self.suite)
+        return result
+
     def __str__(self):
         return f'{self.street_address}, Suite #{self.suite}, {self.city}'
 
 class Employee:
+    __slots__ = ('address', 'name')
+
     def __init__(self, name, address):
         self.address = address
         self.name = name
 
+    # The copy is recorded in 'memo' before the address is copied, so shared Employees stay shared in the
+    # copy and a structure that refers back to this Employee does not recurse forever
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = type(self).__new__(type(self))
+        result.name = self.name
+        result.address = copy.deepcopy(self.address, memo)
+        return result
+
     def __str__(self):
         return f'{self.name} works at {self.address}'
 
 
+# The fixed strings of the Prototypes are interned, so that all the clones share a single copy of each
+# and comparisons between them can be done by identity
+_CITY = sys.intern('London')
+_ADDR1 = sys.intern('123 East Drive')
+_ADDR2 = sys.intern('123B East Drive')
+
 # Prototype Factory class
 class EmployeeFactory:
     # Two Prototypes (static objects)
     main_office_employee = Employee(
-        '', OfficialAddress('123 East Drive', 0, 'London'))
+        '', OfficialAddress(_ADDR1, _CITY, 0))
     aux_office_employee = Employee(
-        '', OfficialAddress('123B East Drive', 0, 'London'))
+        '', OfficialAddress(_ADDR2, _CITY, 0))
 
     # Factory Methods for creating copies (cloning) of 'Employee' objects
     # We are creating Factory methods for a main office employee and an auxillary
     # office employee here.
+    @staticmethod
+    # A hand-written cloner specialized for the known shape of our Prototypes
+    # ('Employee' holding an 'OfficialAddress'). Unlike 'copy.deepcopy()', it does not
+    # need a memo dictionary or any reflection, and creates exactly two new objects.
+    def _clone(proto):
+        a = proto.address
+        return Employee(proto.name, OfficialAddress(a.street_address, a.city, a.suite))
+
     @staticmethod
     # This is a utility method to perform deep-copy!
     # This dunder method (double underscores at the start of method name) is not
     # supposed to be consumed (invoked) from outside the EmployeeFactory class.
     def __new_employee(proto, name, suite):
-        result = copy.deepcopy(proto)
+        result = EmployeeFactory._clone(proto)
         result.name = name
         result.address.suite = suite
         return result
@@ -123,11 +163,12 @@ class EmployeeFactory:
         )
 
 # Create objects using the Prototype Factory methods
-john = EmployeeFactory.new_main_office_employee('John', 101)
-jane = EmployeeFactory.new_aux_office_employee('Jane', 500)
+if __name__ == '__main__':
+    john = EmployeeFactory.new_main_office_employee('John', 101)
+    jane = EmployeeFactory.new_aux_office_employee('Jane', 500)
 
-print(john)
-print(jane)
+    print(john)
+    print(jane)
 
 
 
@@ -139,16 +180,30 @@ print(jane)
 import copy
 
 class Point:
+    __slots__ = ('x', 'y')
     def __init__(self, x=0, y=0):
         self.x = x
         self.y = y
 
 class Line:
-    def __init__(self, start=Point(), end=Point()):
-        self.start = start
-        self.end = end
+    __slots__ = ('start', 'end')
+    # Default arguments are evaluated only once, when the function is defined. Using 'Point()' as the
+    # default would make every 'Line()' share the same two 'Point' objects, so we use 'None' instead.
+    def __init__(self, start=None, end=None):
+        self.start = start if start is not None else Point()
+        self.end = end if end is not None else Point()
 
     def deep_copy(self):
-        new_starting_point = Point(self.start.x, self.start.y)
-        new_ending_point = Point(self.end.x, self.end.y)
-        return Line(new_starting_point, new_ending_point)
\ No newline at end of file
+        # Both classes have a fixed set of slots, so we can allocate the copies with 'object.__new__()'
+        # and fill in the slots directly, without running any '__init__()'
+        start, end = self.start, self.end
+        new_starting_point = object.__new__(Point)
+        new_starting_point.x = start.x
+        new_starting_point.y = start.y
+        new_ending_point = object.__new__(Point)
+        new_ending_point.x = end.x
+        new_ending_point.y = end.y
+        line = object.__new__(Line)
+        line.start = new_starting_point
+        line.end = new_ending_point
+        return line
\ No newline at end of file
@@ -91,17 +91,28 @@ class Database:
     # But, using out implementation of the __new__() (singleton allocator method), we are able
     # to prevent more than one object being created for the Singleton 'Database' class.
     def __init__(self):
+        # Since __init__() runs on every instantiation, we use a flag on the instance to only do the
+        # (possibly expensive) initialization the first time
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
         id = random.randint(1, 101)
         print('id = ', id)
         # print('Loading a database from file')
 
+    # The cheapest way to get the Singleton once it exists: return the stored instance directly,
+    # without going through __new__() and __init__() at all
+    @classmethod
+    def get(cls):
+        return cls._instance if cls._instance else cls()
+
 
 # KEEP IN MIND THAT THE __init__() METHOD IS STILL CALLED TWICE EVEN THOUGH THE SINGLETON CLASS CREATION
-# HAPPENS ONLY ONCE WHEN IT IS INSTANTIATED TWICE!
+# HAPPENS ONLY ONCE WHEN IT IS INSTANTIATED TWICE! (this is why it checks the '_initialized' flag)
 # if __name__ == '__main__':
-    # The instantiation of the Singleton will produce two random numbers that are different because, the
-    # even though the __new__() method is not called only in the first instantiation, the __init__() method
-    # will be called on both the instantiations and will create random numbers both the times.
+    # Without the '_initialized' flag, the instantiation of the Singleton would produce two random numbers
+    # that are different because, even though the __new__() method creates an object only in the first
+    # instantiation, the __init__() method is called on both the instantiations.
     # d1 = Database()
     # d2 = Database()
     # The 'is' operator is used instead of '==' to check for the same object in memory
@@ -113,21 +124,21 @@ class Database:
 # The decorator is a function that takes in another function as argument and returns a function
 # that has additional functionality along with the input function. A decorator can be a function
 # or a class. This decorator below takes a Class as an argument and adds additional functionality
-# to it (the 'get_instance()' method in this case).
+# to it (caching of the instance it creates in this case).
 def singleton(class_):
-    # Keep the single instance for every Class that is decorated with this decorator
-    # in this dictionary as value, with the Class name as key
-    instances = {}
+    # Every call of the decorator decorates a single Class, so the single instance of that Class is kept
+    # in a variable of the closure (no dictionary keyed by the Class, and no hashing on every call)
+    instance = None
     # inner wrapper function of the decorator
     def get_instance(*args, **kwargs):
         # use '*args* and '**kwargs* to allow the inner wrapper
-        # function of the decorator to be flexible with (or without) positional and keyword arguments
-        # if a requested instance for a Class is not already in the instance dictionary,
-        # we create a new instance of the requested Class, add it to the instance dictionary.
-        # and return it. Otherwise, the existing instance from the instance dictionary is returned.
-        if class_ not in instances:
-            instances[class_] = class_(*args, **kwargs)
-        return instances[class_]
+        # function of the decorator to be flexible with (or without) positional and keyword arguments.
+        # The first call creates the instance of the Class, all the following calls return it (their
+        # arguments are ignored) without calling the Class (and its initializer) again.
+        nonlocal instance
+        if instance is None:
+            instance = class_(*args, **kwargs)
+        return instance
     # The decorator returns its inner wrapper function get_instance()
     return get_instance
 
@@ -251,18 +262,32 @@ class Meta(type):
 class Foo(metaclass = Meta):
     pass
 
+# A unique object used to mark a missing entry in a dictionary (unlike 'None', it can never be a
+# real value stored in the dictionary)
+_MISSING = object()
+
 # Metaclass that inherits from the 'type' Class
 class Singleton(type):
+    # The instance of every class is kept alive by this dictionary for the rest of the program (that is what
+    # makes it a Singleton). Use 'clear()' to explicitly drop the instance of a class.
     _instances = {}
     # Overriding the default behavior of the __call__() method of the metaclass
     def __call__(cls, *args, **kwargs):
         # Here, 'cls' corresponds to the class that inherits this metaclass
-        if cls not in cls._instances:
+        instances = cls._instances
+        # A single dictionary lookup instead of checking 'cls not in cls._instances' and then
+        # reading 'cls._instances[cls]'
+        instance = instances.get(cls, _MISSING)
+        if instance is _MISSING:
             # The super() call takes two optional arguments: a sub-class name and an object that
             # is an instance of that sub-class. Here, we are calling the __call__() method of the 
             # 'type' metaclass which this 'Singleton' class inherits
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+            instance = instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        return instance
+
+    # Forget the instance of the class, so that the next call creates a new one (e.g. 'Database.clear()')
+    def clear(cls):
+        cls._instances.pop(cls, None)
     
 class Database(metaclass=Singleton):
     def __init__(self):
@@ -298,16 +323,39 @@ class CEO:
     def __str__(self):
         return f'{self.name} is {self.age} years old'
 
-# Package the Monostate as a Base class that can be inherited
+# A descriptor for an attribute whose value is shared by all the instances of a class. Reading or writing
+# the attribute on any instance reads or writes the '_shared_state' dictionary of the class instead of the
+# '__dict__' of the instance.
+class Shared:
+    # called when the descriptor is assigned to a name in a class body
+    def __set_name__(self, owner, name):
+        self.name = name
+    def __get__(self, instance, owner):
+        if instance is None: # accessed on the class itself
+            return self
+        try:
+            return owner._shared_state[self.name]
+        except KeyError: # never set - report it like any other missing attribute
+            raise AttributeError(self.name) from None
+    def __set__(self, instance, value):
+        type(instance)._shared_state[self.name] = value
+
+# Package the Monostate as a Base class that can be inherited. The shared attributes are declared in
+# the inheriting classes with the 'Shared' descriptor, so nothing has to be done when an instance is
+# created (there is no need to replace the '__dict__' of every new instance in __new__()) and the
+# instances do not even need a '__dict__'.
 class Monostate:
-    _shared_state = {}
-    # oerriding the __new__() method that will be invoked before __init__() during instantiation
-    def __new__(cls, *args, **kwargs):
-        obj = super().__new__(cls, *args, **kwargs)
-        obj.__dict__ = cls._shared_state
-        return obj
+    __slots__ = ()
+    # every inheriting class gets its own shared state
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._shared_state = {}
 
 class CFO(Monostate):
+    __slots__ = ()
+    name = Shared()
+    money_managed = Shared()
+
     def __init__(self):
         self.name = ''
         self.money_managed = 0
@@ -346,40 +394,58 @@ if __name__ == '__main__':
 import unittest
 
 class Singleton(type):
-    _instances = {}
+    # Instead of one dictionary of instances keyed by class, every class gets its own '_instance' slot
+    # when it is created, so getting the instance is a plain attribute read with no hashing.
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._instance = _MISSING
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instance
+        if instance is _MISSING:
+            instance = cls._instance = super().__call__(*args, **kwargs)
+        return instance
+    # Forget the instance of the class (e.g. between tests), so that the next call creates a new one
+    def clear(cls):
+        cls._instance = _MISSING
 
 class Database(metaclass=Singleton):
     def __init__(self):
-        self.population = {}
-        f = open('capitals.txt', 'r')
-        lines = f.readlines()
-        for i in range(0, len(lines), 2):
-            self.population[lines[i].strip()] = int(lines[i+1].strip())
-        f.close()
+        self._population = None
+
+    # Lazy initialization: the file is only read the first time the population is actually needed
+    # (creating the Database, like the default argument of 'ConfigurableRecordFinder' below does, is cheap)
+    @property
+    def population(self):
+        if self._population is None:
+            self._population = self._load()
+        return self._population
+
+    @staticmethod
+    def _load():
+        # The file has the name of a city on one line and its population on the next one. City names
+        # can contain spaces, so we split the file by lines (not by whitespace). The names are the
+        # even lines and the populations the odd ones, which are paired up with 'zip()'.
+        with open('capitals.txt', 'r') as f:
+            lines = [line.strip() for line in f.read().splitlines()]
+        return dict(zip(lines[0::2], map(int, lines[1::2])))
+
+# Add up the populations of the given cities (any iterable of city names). 'map()' calls the bound
+# '__getitem__' of the dictionary for every city and 'sum()' adds up the values, both looping in C.
+def _total_population(population, cities):
+    return sum(map(population.__getitem__, cities))
 
 class SingletonRecordFinder:
     def total_population(self, cities):
-        result = 0
-        for c in cities:
-            # An instance of the Singleton class 'Database' is created (first iteration) or 
-            # referenced (second iteration onwards) for every city passed to this method and then, 
-            # the population is added to the result
-            result += Database().population[c]
-        return result
+        # An instance of the Singleton class 'Database' is created (first call) or referenced (later
+        # calls) and then, the population of every city passed to this method is added to the result.
+        return _total_population(Database().population, cities)
 
 class ConfigurableRecordFinder:
     def __init__(self, db=Database()):
         self.db = db
     def total_population(self, cities):
-        result = 0
-        for c in cities:
-            # Here, the database is created only once and it is used everytime the loop runs 
-            result += self.db.population[c]
-        return result
+        # Here, the database is created only once and it is used for every city
+        return _total_population(self.db.population, cities)
 
 # A dummy database with predictable values for testing
 class DummyDatabase:
@@ -15,6 +15,7 @@ from enum import Enum
 # import Base Class and decorator to be used for implementing abstract methods (methods without a body 
 # that must be implemented in the child classes). 
 from abc import ABC, abstractmethod
+import sys # for interning strings
 
 # The enum members have names and values (the name of Color.RED is RED, the value of Color.BLUE is 3, etc.)
 class Relationship(Enum):
@@ -23,8 +24,11 @@ class Relationship(Enum):
     SIBLING = 2
 
 class Person:
+    __slots__ = ('name',)
     def __init__(self, name):
-        self.name = name
+        # Names are interned, so that equal names are usually the very same string object (and '=='
+        # returns as soon as it sees that both sides are the same object, without comparing characters)
+        self.name = sys.intern(name)
 
 # A low-level interface with utility-functions declared as abstract methods that helps to uphold
 # the dependency inversion principles. If the internal storage in the 'Relationships' class changes,
@@ -41,6 +45,10 @@ class RelationshipBrowser(ABC):
 class Relationships(RelationshipBrowser):
     def __init__(self):
         self.relations = []
+        # An index of the names of the children of every parent (keyed by the name of the parent),
+        # kept up to date while relationships are added, so that finding the children of a person is a
+        # single dictionary lookup instead of a scan through all the relations
+        self._children_by_parent = {}
     
     def add_parent_and_child(self, parent, child):
         self.relations.append(
@@ -49,11 +57,12 @@ class Relationships(RelationshipBrowser):
         self.relations.append(
             (child, Relationship.CHILD, parent)
         )
+        self._children_by_parent.setdefault(parent.name, []).append(child.name)
     # abstract method implementation in the inheriting sub-class
     def find_all_children_of(self, name):
-        for r in self.relations:
-            if r[0].name == name and r[1] == Relationship.PARENT:
-                yield r[2].name # makes this function return a generator
+        # Since the internal storage is hidden behind this utility method, the high-level modules
+        # are not affected by the index
+        return list(self._children_by_parent.get(name, ())) # a copy, callers cannot modify the index
 
 # class Research:
     # Accessing the internal storage mechanism and data structure of 'Relatonships' class
@@ -59,7 +59,7 @@ class Fax(ABC):
     def fax(self, document):
         pass
 
-def PhotoCopier(Printer, Scanner): # Multiple Inheritance
+class PhotoCopier(Printer, Scanner): # Multiple Inheritance
     def print(self, document):
         pass
     def scan(self, document):
@@ -67,25 +67,47 @@ def PhotoCopier(Printer, Scanner): # Multiple Inheritance
 
 # You can also create an Interface that can combines the functionalities of multiple other
 # interfaces and can be used as a Base Class!
-def MultiFunctionDevice(ABC):
+class MultiFunctionDevice(Printer, Scanner):
     # Override the inherited methods and declare them as abstract methods
     @abstractmethod # A decorator to declare abstract method (method without a body that must be
     # implemented compulsarily in the inheriting child classes)
-    def scan(self, document):
+    def print(self, document):
         pass
     @abstractmethod # A decorator to declare abstract method (method without a body that must be
     # implemented compulsarily in the inheriting child classes)
-    def fax(self, document):
+    def scan(self, document):
         pass
 
 # Now, we can inherit the newly created combination Base Class!
-def MultiFunctionMachine(MultiFunctionDevice):
+class MultiFunctionMachine(MultiFunctionDevice):
     def __init__(self, printer, scanner):
         self.printer =  printer
         self.scanner = scanner
 
+    # Setting a device also binds its method directly on the instance. Calling 'machine.print(document)'
+    # then calls 'printer.print(document)' straight away, without going through the delegating methods
+    # below (an instance attribute takes precedence over a method of the class). Replacing a device binds
+    # the method of the new device.
+    @property
+    def printer(self):
+        return self._printer
+    @printer.setter
+    def printer(self, printer):
+        self._printer = printer
+        self.print = printer.print
+
+    @property
+    def scanner(self):
+        return self._scanner
+    @scanner.setter
+    def scanner(self, scanner):
+        self._scanner = scanner
+        self.scan = scanner.scan
+
+    # The delegating methods implement the abstract methods of the interface (a class that does not
+    # implement them cannot be instantiated)
     def print(self, document):
-        self.printer.print(document)
+        return self.printer.print(document)
 
     def scan(self, document):
-        self.scanner.scan(document)
\ No newline at end of file
+        return self.scanner.scan(document)
@@ -6,11 +6,13 @@
 # Objects of the Subclass should behave the same way and must be replaceable with objects of the Superclass
 
 class Rectangle:
+    # '__slots__' replaces the per-instance '__dict__' with a fixed set of attributes.
+    # 'width' and 'height' are plain (public) attributes: nothing has to happen when they are read or
+    # written, so there is no need for a getter and a setter (that would be called on every access).
+    __slots__ = ('width', 'height')
     def __init__(self, width, height):
-        # the attributes 'height' and 'width' are non-public attributes (ther apre prefixed with '_')
-        # to indicate that they should not be accessed using the '.' operator.
-        self._height = height
-        self._width = width
+        self.height = height
+        self.width = width
     # Properties represent an intermediate functionality between a plain attribute (or field) and a method. 
     # In other words, they allow you to create methods that behave like attributes. 
     # With properties, you can change how you compute the target attribute whenever you need to do so.
@@ -18,7 +20,7 @@ class Rectangle:
     # them right before your users access and mutate them.
     # The main advantage of Python properties is that they allow you to expose your attributes as part of your 
     # public API. If you ever need to change the underlying implementation, then you can turn the attribute into 
-    # a property at any time without much pain. 
+    # a property at any time without much pain (like the 'Square' class below does for 'width' and 'height'). 
 
     # Python’s property() is the Pythonic way to avoid formal getter and setter methods in your code. 
     # This function allows you to turn class attributes into properties or managed attributes. 
@@ -31,39 +33,32 @@ class Rectangle:
     # '.setter' and '.deleter', respectively.
     @property
     def area(self):
-        return self._width * self._height
+        return self.width * self.height
     def __str__(self):
         return f'Width: {self.width}, Height: {self.height}'
-    @property
-    def width(self):
-        return self._width
-
-    @width.setter
-    def width(self, value):
-        self._width = value
-
-    @property
-    def height(self):
-        return self._height
-
-    @height.setter
-    def height(self, value):
-        self._height = value
 
     
 
 class Square(Rectangle):
+    __slots__ = ('_size',) # a square only needs to store a single size
     def __init__(self, size):
         Rectangle.__init__(self, size, size)
         # Whatever happens, the square should satisfy height == width
         # UNFORTUNATELY, THIS BREAKS THE LISKOV SUBSTITUTION PRINCIPLE!
         # THE SETTERS BELOW VIOLATE THE LISKOV SUBSTITUTION PRINCIPLE!
-    @Rectangle.width.setter
+    # Only the Square needs coupled 'width' and 'height', so only the Square turns them into properties
+    @property
+    def width(self):
+        return self._size
+    @width.setter
     def width(self, value):
-        self._width = self._height = value
-    @Rectangle.height.setter
+        self._size = value
+    @property
+    def height(self):
+        return self._size
+    @height.setter
     def height(self, value):
-        self._width = self._height = value
+        self._size = value
 
 # function to check if the expected area matches the calculated area
 # This function holds true only for the Rectangle class and does not work
@@ -4,25 +4,33 @@
 # Assume that you own a website that sells products. The products will have their own classes with properties
 # like color, size etc.
 
-# An enumeration is a set of symbolic names (members) bound to unique values
-from enum import Enum
+# An enumeration is a set of symbolic names (members) bound to unique values. The members of an 'IntEnum'
+# are also plain integers, so comparing them is a fast integer comparison.
+from enum import IntEnum
+from array import array # compact array of basic values (like integers)
+from itertools import compress # filter an iterable with a mask of booleans
+import weakref # for the pools of specifications that do not keep them alive
 
 # The enum members have names and values (the name of Color.RED is RED, the value of Color.BLUE is 3, etc.)
-class Color(Enum):
+class Color(IntEnum):
     RED = 1
     GREEN = 2
     BLUE = 3
 
-class Size(Enum):
+class Size(IntEnum):
     SMALL = 1
     MEDIUM = 2
     LARGE = 3
 
 class Product:
+    # '_ci' and '_si' keep the integer values of the color and size, which the specifications compare
+    __slots__ = ('name', 'color', 'size', '_ci', '_si')
     def __init__(self, name, color, size):
         self.name = name
         self.color = color
         self.size = size
+        self._ci = color.value
+        self._si = size.value
 
 # Now let's assume that one of the requirements in your application is to filter the products by color.
 
@@ -55,11 +63,29 @@ class ProductFilter:
 
 # Class to determine whether a particular item satisfies a particular criteria
 class Specification: # Base Class that will be inherited and extended
+    # Specifications have a fixed set of attributes, so they are declared with '__slots__' (in every
+    # class of the hierarchy) instead of keeping a '__dict__' for every instance
+    __slots__ = ()
     def is_satisfied(self, item):
         pass
+    # Check a whole collection of products at once. The colors and sizes of the products are given as
+    # two parallel arrays of their Enum values (a "structure of arrays") and an iterator yielding one
+    # boolean for every product is returned. Since the masks are lazy iterators, combined masks are
+    # computed in a single pass over the arrays, without building any intermediate lists.
+    def mask(self, colors, sizes):
+        pass
     # We can also overlaod the '&' operator in python to make it combine multiple Specification instances!
     def __and__(self, other):
-        return AndSpecification(self, other)
+        # The most common combination, one color and one size, gets a specialized specification
+        if type(self) is ColorSpecification and type(other) is SizeSpecification:
+            return ColorAndSizeSpecification(self, other)
+        if type(self) is SizeSpecification and type(other) is ColorSpecification:
+            return ColorAndSizeSpecification(other, self)
+        # 'a & b & c' is flattened into a single AndSpecification of all three specifications instead
+        # of an AndSpecification nested inside another one
+        left = self.args if isinstance(self, AndSpecification) else (self,)
+        right = other.args if isinstance(other, AndSpecification) else (other,)
+        return AndSpecification(*left, *right)
 
 
 class Filter: # Base class that will be inherited and extended with the filtering criterion logic
@@ -68,27 +94,73 @@ class Filter: # Base class that will be inherited and extended with the filterin
         pass
 
 # Now, suppose you want to filter by color:
+# 'ColorSpecification(Color.GREEN)' returns the same instance for as long as it is in use (it is interned in
+# '__new__'), so creating the same specification again and again does not allocate a new object every time.
+# The pool only references its specifications weakly, so the ones that are no longer used are removed from it
+# ('__weakref__' in the slots allows the weak references).
 class ColorSpecification(Specification):
-    def __init__(self, color):
-        self.color = color
+    __slots__ = ('color', '__weakref__')
+    _pool = weakref.WeakValueDictionary() # the one instance for every color (specifications are immutable,
+    # so they can be shared)
+    def __new__(cls, color):
+        color = int(color) # the specification only keeps the integer value of the enum member
+        spec = cls._pool.get(color)
+        if spec is None:
+            spec = super().__new__(cls)
+            spec.color = color
+            cls._pool[color] = spec
+        return spec
     def is_satisfied(self, item):
-        return item.color == self.color
+        return item._ci == self.color
+    def mask(self, colors, sizes):
+        return map(self.color.__eq__, colors)
 
 class SizeSpecification(Specification):
-    def __init__(self, size):
-        self.size = size
+    __slots__ = ('size', '__weakref__')
+    _pool = weakref.WeakValueDictionary() # the one instance for every size
+    def __new__(cls, size):
+        size = int(size) # the specification only keeps the integer value of the enum member
+        spec = cls._pool.get(size)
+        if spec is None:
+            spec = super().__new__(cls)
+            spec.size = size
+            cls._pool[size] = spec
+        return spec
     def is_satisfied(self, item):
-        return item.size == self.size
+        return item._si == self.size
+    def mask(self, colors, sizes):
+        return map(self.size.__eq__, sizes)
     
 # We can also build COMBINATOR SPECIFICATION CLASSES
 class AndSpecification(Specification):
     # This specification can take up variable number of filter criterion
     # An item should satisfy every single one of those criterion
+    __slots__ = ('args',)
     def __init__(self, *args): # constructor takes up variable number of arguments (Specification instances)
         self.args = args
     def is_satisfied(self, item):
-        # Map every specification passed in and check if every one of them is satisfied by the item
-        return all(map(lambda spec: spec.is_satisfied(item), self.args))
+        # Check every specification passed in and stop at the first one that is not satisfied by the item
+        for spec in self.args:
+            if not spec.is_satisfied(item):
+                return False
+        return True
+    def mask(self, colors, sizes):
+        # combine the masks of all the specifications, position by position
+        return map(all, zip(*[spec.mask(colors, sizes) for spec in self.args]))
+
+# An AndSpecification of exactly one ColorSpecification and one SizeSpecification. Instead of looping over the
+# specifications, it generates (with 'exec') a check with the color and size values written in as constants,
+# so checking an item is just two integer comparisons. For green and large products, the generated code is:
+#
+# def is_satisfied(item): return item._ci == 2 and item._si == 3
+class ColorAndSizeSpecification(AndSpecification):
+    __slots__ = ('is_satisfied',) # the generated function replaces the 'is_satisfied()' method
+    def __init__(self, color_spec, size_spec):
+        super().__init__(color_spec, size_spec)
+        namespace = {}
+        exec(f'def is_satisfied(item): return item._ci == {color_spec.color} and item._si == {size_spec.size}',
+             namespace)
+        self.is_satisfied = namespace['is_satisfied']
     
 class BetterFilter(Filter):
     # This method is not included in the Filter Base Class because this allows for flexibility in the
@@ -98,6 +170,32 @@ class BetterFilter(Filter):
         for item in items:
             if spec.is_satisfied(item):
                 yield item # makes this function return a generator
+    # When all the matching items are needed anyway, building the list in one go is faster than
+    # resuming a generator for every item
+    def filter_list(self, items, spec):
+        return [item for item in items if spec.is_satisfied(item)]
+
+# A fast path for the most common filtering (by color and/or size) when specifications are not needed: one
+# plain loop over integer comparisons that builds a list, without enums, generators or lambdas. This kind of
+# code is what JIT compilers (like the one in PyPy) optimize best - running the same script under PyPy
+# instead of CPython can speed it up several times without any other changes.
+def filter_fast(items, color=None, size=None):
+    ci = -1 if color is None else int(color) # only compared when a color is given
+    si = -1 if size is None else int(size)
+    result = []
+    for item in items:
+        if (color is None or item._ci == ci) and (size is None or item._si == si):
+            result.append(item)
+    return result
+
+# Another extension of the Filter class which does not look at the products one by one. Instead, the
+# colors and sizes of all the products are packed into two compact arrays first and the Specification
+# computes a mask for all of them at once, with the loops running in C ('map()' and 'compress()').
+class PackedFilter(Filter):
+    def filter(self, items, spec):
+        colors = array('b', [item._ci for item in items])
+        sizes = array('b', [item._si for item in items])
+        return compress(items, spec.mask(colors, sizes))
 
 if __name__ == '__main__':
     apple = Product('Apple', Color.GREEN, Size.SMALL)
@@ -116,17 +214,25 @@ if __name__ == '__main__':
     bf = BetterFilter()
     print('Green products (new):')
     green = ColorSpecification(Color.GREEN)
-    for p in bf.filter(products, green):
+    for p in bf.filter_list(products, green):
         print(f'    - {p.name} is green')
     
     # Finding all the large products
     print('Large products:')
     large = SizeSpecification(Size.LARGE)
-    for p in bf.filter(products, large):
+    for p in bf.filter_list(products, large):
         print(f'    - {p.name} is large')
 
     print('large blue items:')
     # large_blue = AndSpecification(large, ColorSpecification(Color.BLUE))
     large_blue = large & ColorSpecification(Color.BLUE)
-    for p in bf.filter(products, large_blue):
+    for p in bf.filter_list(products, large_blue):
         print(f'    - {p.name} is large and blue')
+
+    print('large green items (fast):')
+    for p in filter_fast(products, Color.GREEN, Size.LARGE):
+        print(f'    - {p.name} is large and green')
+
+    print('large green items (packed):')
+    for p in PackedFilter().filter(products, large & green):
+        print(f'    - {p.name} is large and green')
@@ -1,18 +1,40 @@
 # SRP / SOC (Single Responsibility Principle / Seperation of Concerns)
 
+import locale
+
+# The encoding that 'open()' uses for text files by default, so the saved journal has the same bytes as
+# writing 'str(journal)' to a file opened with 'open(filename, 'w')'
+_ENCODING = locale.getpreferredencoding(False)
+
 # A class to hold personal Journal entries
 class Journal:
     # constructor
     def __init__(self):
         self.entries = [] # List to hold journal entries
         self.count = 0 # Count of number of entries in the journal
+        # The encoded text of all the entries (one per line), kept up to date as entries are added or removed
+        # so that it does not have to be rebuilt from the list of entries every time the journal is saved.
+        # '_sizes' holds the number of bytes of every entry (with its newline) in the buffer.
+        self._buf = bytearray()
+        self._sizes = []
     def add_entry(self, text): # method to add an entry to the journal
         self.count += 1 
-        self.entries.append(f'{self.count}: {text}')
+        entry = f'{self.count}: {text}'
+        self.entries.append(entry)
+        data = f'{entry}\n'.encode(_ENCODING)
+        self._buf += data
+        self._sizes.append(len(data))
     def remove_entry(self, pos): # method to delete an entry at given position from the joirnal
         del self.entries[pos]
+        # only the bytes of the removed entry are cut out of the buffer
+        start = sum(self._sizes[:pos])
+        del self._buf[start:start + self._sizes.pop(pos)]
+    # The encoded text of the journal (without the newline after the last entry), as a read-only view of the
+    # buffer instead of a copy. Release the view (e.g. with a 'with' block) before adding or removing entries.
+    def encoded(self):
+        return memoryview(self._buf)[:-1].toreadonly()
     def __str__(self): # string representation of journal entries
-        return '\n'.join(self.entries)
+        return self._buf[:-1].decode(_ENCODING) # without the newline after the last entry
     # THE METHODS BELOW ADD ADDITIONAL FUNCTIONALITY OF DATA PERSISTANCE TO THE CLASS FOR CREATING AND LOADING
     # THE JOURNAL FROM PARTICULAR RESOURCES. THIS IS A BAD IDEA BECAUSE YOU COULD HAVE AN APPLICATION WHERE
     # YOU HAVE DATA HOLDING CLASSES LIKE THIS JOURNAL CLASS. WHEN ALL THEESE CLASS TYPES HAVE TO BE PERSISTED, IT
@@ -37,8 +59,12 @@ class Journal:
 class PersistenceManager:
     @staticmethod # class method
     def save_to_file(journal, filename):
-        with open(filename, 'w') as fh:
-            fh.write(str(journal))
+        # The journal is already one encoded buffer, so it is handed straight to the OS without an extra
+        # copy into a write buffer (an unbuffered write may write only part of it, hence the loop)
+        with open(filename, 'wb', buffering=0) as fh, journal.encoded() as view:
+            written = 0
+            while written < len(view):
+                written += fh.write(view[written:])
 
 # Create an instance of the class, populate it and use it
 j = Journal()
@@ -7,7 +7,12 @@
 # the Adaptee (the class that needs adaptation to the requirement). When intermediate representations
 # pile up, use caching and other optimizations!
 
+import sys
+from functools import lru_cache
+from itertools import count
+
 class Point:
+    __slots__ = ('x', 'y')
     def __init__(self, x, y):
         self.y = y
         self.x = x
@@ -16,73 +21,73 @@ class Point:
 def draw_point(p):
     print('.', end="")
 
+# the same API for a whole batch of points: a single write instead of one print() call per point
+def draw_points(points):
+    sys.stdout.write('.' * len(points))
+
 # ^^ You are given this as the starting point - use this code to draw rectangles
 
 # Here, we want to represent a Line as a series of Points
 # vv implementation built using Adapter pattern
 
+# Every Rectangle below is made of 4 Lines of 2 Points each, so 'Point' and 'Line' use '__slots__' to
+# keep these many small objects compact (no '__dict__' per object)
+
 class Line:
+    __slots__ = ('start', 'end')
     def __init__(self, start, end):
         self.start = start
         self.end = end
 
+# Points on the line from (x0, y0) to (x1, y1), both ends included. The line is split into as many
+# steps as its longest axis, so vertical, horizontal and slanted lines all go through the same code
+# (no branching on the orientation of the line). map() drives the Point constructor from C instead
+# of a Python-level append loop, and the points are returned in an immutable tuple
+def _line_points(x0, y0, x1, y1):
+    dx, dy = x1 - x0, y1 - y0
+    steps = max(abs(dx), abs(dy))
+    n = steps or 1 # a zero-length line is a single point
+    return tuple(map(Point, [x0 + dx * i // n for i in range(steps + 1)],
+                            [y0 + dy * i // n for i in range(steps + 1)]))
+
 # A rectangle represented by a list of lines
 class Rectangle(list):
     def __init__(self, x, y, width, height):
-        super().__init__() # calling the parent class constructor
-        # The four sides of a Rectangle
-        self.append(Line(Point(x, y), Point(x + width, y)))
-        self.append(Line(Point(x + width, y), Point(x + width, y + height)))
-        self.append(Line(Point(x, y), Point(x, y + height)))
-        self.append(Line(Point(x, y + height), Point(x + width, y + height)))
+        # calling the parent class constructor with the four sides of a Rectangle (the list is
+        # created with all of them at once instead of appending them one by one)
+        super().__init__((
+            Line(Point(x, y), Point(x + width, y)),
+            Line(Point(x + width, y), Point(x + width, y + height)),
+            Line(Point(x, y), Point(x, y + height)),
+            Line(Point(x, y + height), Point(x + width, y + height)),
+        ))
 
 
 # Adapter class - one instance of this is created for each 'Line' instance
 class LineToPointAdapter(list):
-    # 'count' is the number of Points generated (class variable - only used when no caching)
-    count = 0
+    # '_counter' numbers the adapters as they are created (class variable - only used when no caching).
+    # 'self.count += 1' would not work here: it would store a new 'count' on the instance, so every
+    # adapter would be number 1.
+    _counter = count(1)
     def __init__(self, line):
         super().__init__() # invoking the constructor of 'List' (parent class)
-        self.count += 1
-        print(f'{self.count}: Generating points for line [{line.start.x}, {line.start.y}] -> [{line.end.x}, {line.end.y}]')
-        # Get the start, end , top, bottom of the line (line can be slanted, at an angle)
-        left = min(line.start.x, line.end.x)
-        right = max(line.start.x, line.end.x)
-        top = max(line.start.y, line.end.y)
-        bottom = min(line.start.y, line.end.y)
-
-        if right - left == 0: # if line is parallel to the y axis
-            for y in range(top, bottom):
-                self.append(Point(left, y))
-        elif line.end.y - line.start.y == 0: # if line is parallel to the x axis
-            for x in range(left, right):
-                self.append(Point(x, top))
-
-class LineToPointAdapterCached: # Inheritance of the 'list' class is omitted because of caching in dictionary
-    cache = {} # To avoid regenerating the same points upon subsequent instaltiation of this class
-    # This 'cache' is a dictionary of list of points
+        self.instance_id = next(self._counter)
+        print(f'{self.instance_id}: Generating points for line [{line.start.x}, {line.start.y}] -> [{line.end.x}, {line.end.y}]')
+        self.extend(_line_points(line.start.x, line.start.y, line.end.x, line.end.y))
+
+# To avoid regenerating the same points for the same line, the points are cached by the coordinates of
+# the line (not by 'hash(line)', which is the identity of the 'Line' object - two Lines with the same
+# coordinates would never share an entry). 'lru_cache' also bounds the size of the cache.
+@lru_cache(maxsize=4096)
+def points_for_line(x0, y0, x1, y1):
+    print(f'Generating points for line [{x0}, {y0}] -> [{x1}, {y1}]')
+    return _line_points(x0, y0, x1, y1)
+
+class LineToPointAdapterCached: # Inheritance of the 'list' class is omitted because of caching in 'points_for_line'
     def __init__(self, line):
         super().__init__() # invoking the constructor of 'List' (parent class)
-        self.h = hash(line) # calculate a unique hash value for every unique line to be stored in the cache
-        if self.h in self.cache:
-            return # do nothing if the list of points in the rectangle is already cached
-        print(f'Generating points for line [{line.start.x}, {line.start.y}] -> [{line.end.x}, {line.end.y}]')
-        # Get the start, end , top, bottom of the line (line can be slanted, at an angle)
-        left = min(line.start.x, line.end.x)
-        right = max(line.start.x, line.end.x)
-        top = max(line.start.y, line.end.y)
-        bottom = min(line.start.y, line.end.y)
-
-        points = [] # list of points in the rectangle
-
-        if right - left == 0: # if line is parallel to the y axis
-            for y in range(top, bottom):
-                points.append(Point(left, y))
-        elif line.end.y - line.start.y == 0: # if line is parallel to the x axis
-            for x in range(left, right):
-                points.append(Point(x, top))
-
-        self.cache[self.h] = points
+        self.h = (line.start.x, line.start.y, line.end.x, line.end.y) # the key of this line in the cache
+        self.points = points_for_line(*self.h)
 
         # Define the iteration behaviour of an instance of this class since we iterate over it
         # in the 'draw_rectangle' function defined below.
@@ -91,15 +96,15 @@ class LineToPointAdapterCached: # Inheritance of the 'list' class is omitted bec
         # It optionally takes an additional argument called the sentinel element which will
         # terminate the iteration sequence when encountered by the __next__() call on the 
         # object returned by iter()
-        return iter(self.cache[self.h])
+        return iter(self.points)
 
 def draw_rectangle(rcs):
     print('\n\n--- Drawing some stuff ---\n')
     for rc in rcs: # for every 'Rectangle' instance in the 'rcs' list
+        points = []
         for line in rc: # for each line in the list of 'Rectangle' instance
-            adapter = LineToPointAdapterCached(line) # Instantiate the Adapter for every 'Line' object
-            for p in adapter: # for every point in the adapter (list)
-                draw_point(p)
+            points.extend(LineToPointAdapterCached(line)) # Instantiate the Adapter for every 'Line' object
+        draw_points(points) # draw all the points of the rectangle at once
 
 
 if __name__ == '__main__':
@@ -22,13 +22,16 @@
 # for this purpose like VectorCircle, VectorSquare, RasterCircle, RasterSquare etc, we can reduce the complexity
 # by following the Bridge pattern.
 
-from abc import ABC # for creating abstract base classes with abstract methods, we import and inherit this class
+from abc import ABC, abstractmethod # for creating abstract base classes with abstract methods, we import and inherit this class
 
 class Renderer(ABC):
-    # abstract method - A method without a body
+    __slots__ = ()
+    # abstract method - A method without a body (every renderer has to implement it)
+    @abstractmethod
     def render_circle(self, radius):
         pass
-    # abstract method - A method without a body
+    # abstract method - A method without a body (every renderer has to implement it)
+    @abstractmethod
     def render_square(self, side):
         pass
 
@@ -37,6 +40,7 @@ class Renderer(ABC):
 # every type of the 'Renderer' class Hierarchy - VIOLATION OF THE OPEN-CLOSED PRINCIPLE. But unfortunately,
 # nothing can be done to improve this because of the objective being reduction of "complexity explostion"!
 class VectorRenderer(Renderer):
+    __slots__ = ()
     def render_circle(self, radius):
         print(f'Drawing a circle of radius {radius}')
     def render_square(self, side):
@@ -44,17 +48,20 @@ class VectorRenderer(Renderer):
 
 
 class RasterRenderer(Renderer):
+    __slots__ = ()
     def render_circle(self, radius):
         print(f'Drawing pixels for a circle of radius {radius}')
     def render_square(self, side):
         print(f'Drawing pixels for a square of side {side}')
 
 
-class Shape:
+class Shape(ABC):
     # Core of the Bridge design pattern - connect the renderer to the shape
     def __init__(self, renderer):
         self.renderer = renderer
+    @abstractmethod
     def draw(self): pass
+    @abstractmethod
     def resize(self, factor): pass
 
 
@@ -63,10 +70,19 @@ class Circle(Shape):
         super().__init__(renderer) # call the Base class (Shape) initializer with the passed in 
         # 'renderer' object which can be instance of any one of 'VectorRenderer' or 'RasterRenderer'
         self.radius = radius
+    # The bound 'render_circle' method of the renderer is looked up once instead of on every 'draw()'.
+    # Swapping the renderer looks it up again, so the circle is always drawn by its current renderer.
+    @property
+    def renderer(self):
+        return self._renderer
+    @renderer.setter
+    def renderer(self, renderer):
+        self._renderer = renderer
+        self._render = renderer.render_circle
     def draw(self):
         # Use the Bridge pattern to make the connection between a renderer and a shape class Hierarchy, then 
         # use this connection to utilize the functionalities of renderer from within the shape class
-        self.renderer.render_circle(self.radius)
+        self._render(self.radius)
     def resize(self, factor):
         self.radius *= factor
 
@@ -90,27 +106,42 @@ if __name__ == '__main__':
 # TODO: reimplement Shape, Square, Triangle and Renderer/VectorRenderer/RasterRenderer such that
 # 'str(Triangle(RasterRenderer()))'  returns "Drawing Triangle as pixels" 
 
+# 'what_to_render_as' never changes, so it is a plain class attribute rather than a '@property' (no
+# function is called on every access)
 class Renderer(ABC):
-    @property
-    def what_to_render_as(self):
-        return None
+    what_to_render_as = None
 
 class VectorRenderer(Renderer):
-    @property
-    def what_to_render_as(self):
-        return 'lines'
+    what_to_render_as = 'lines'
         
 class RasterRenderer(Renderer):
-    @property
-    def what_to_render_as(self):
-        return 'pixels'
+    what_to_render_as = 'pixels'
 
 class Shape:
     def __init__(self, name, renderer):
+        self._str = None # the string representation, built on the first call to '__str__()'
         self.renderer = renderer
         self.name = name
+    # Swapping the renderer or renaming the shape changes the string representation, so the cached one
+    # is dropped
+    @property
+    def renderer(self):
+        return self._renderer
+    @renderer.setter
+    def renderer(self, renderer):
+        self._renderer = renderer
+        self._str = None
+    @property
+    def name(self):
+        return self._name
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self._str = None
     def __str__(self):
-        return 'Drawing {} as {}'.format(self.name, self.renderer.what_to_render_as)
+        if self._str is None:
+            self._str = 'Drawing {} as {}'.format(self._name, self._renderer.what_to_render_as)
+        return self._str
         
 class Square(Shape):
     def __init__(self, renderer):
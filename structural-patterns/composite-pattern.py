@@ -35,6 +35,9 @@ from abc import ABC  # For creating abstract class
 
 
 class GraphicObject:
+    # Drawings can hold many shapes, so the attributes are declared with '__slots__' (no '__dict__' for every
+    # instance) in this class and its subclasses
+    __slots__ = ('color', 'children', '_name')
     def __init__(self, color=None):
         self.color = color
         self.children = []  # container for individual shape components
@@ -44,28 +47,33 @@ class GraphicObject:
     def name(self):
         return self._name
 
-    # utility method for string representation of an instance of this class
+    # string representation of an instance of this class
     # It creates an unordered list of unordered sub-lists, along with the depth information encoded with
     # the number of '*' characters before the color and name of the shape.
-    def _print(self, items, depth):
-        items.append('*' * depth)
-        if self.color:
-            items.append(self.color)
-        # Notice the newline character added here to
-        items.append(f'{self.name}\n')
-        for child in self.children:  # recursively call the _print() method on the children of the
-            # current child of this 'Graphbject' instance.
-            child._print(items, depth + 1)
-
     def __str__(self):
         items = []
-        # Using the helper method, build an array of strings to be printed that contains the depth
-        # and parent-child relationships between the sub-groups of shapes within a grouped graph object.
-        self._print(items, 0)
+        # Walk the tree of shapes with an explicit stack of (shape, depth) pairs instead of recursive calls,
+        # so deeply nested groups cannot hit the recursion limit. The array of strings to be printed
+        # contains the depth and parent-child relationships between the sub-groups of shapes within a
+        # grouped graph object.
+        stack = [(self, 0)]
+        # The '*' prefix of every depth is built once and shared by all the shapes at that depth. A shape is
+        # only reached after its parent, so the prefixes grow one depth at a time.
+        prefixes = []
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(prefixes):
+                prefixes.append('*' * depth)
+            # One line (with a newline character at the end) for every shape: its depth prefix, its color
+            # (if any) and its name are formatted together instead of being added to the array one by one
+            items.append(f'{prefixes[depth]}{node.color or ""}{node.name}\n')
+            # the children are pushed in reverse, so that the first child is popped (and printed) first
+            stack.extend((child, depth + 1) for child in reversed(node.children))
         return ''.join(items)  # convert the array as a single string
 
 
 class Circle(GraphicObject):
+    __slots__ = ()
     # Properties represent an intermediate functionality between a plain attribute (or field) and a method.
     # In other words, they allow you to create methods that behave like attributes.
     # With properties, you can change how you compute the target attribute whenever you need to do so.
@@ -90,6 +98,7 @@ class Circle(GraphicObject):
 
 
 class Square(GraphicObject):
+    __slots__ = ()
     @property
     def name(self):
         return 'Square'
@@ -125,21 +134,29 @@ if __name__ == '__main__':
 # of this class!
 
 class Connectable(Iterable, ABC):
+    __slots__ = ()  # neural networks have many neurons, so the classes below use '__slots__' as well
     def connect_to(self, other):
-        if self == other:  # A neuron layer cannot connect to itself!
+        if self is other:  # A neuron layer cannot connect to itself!
             return
-        for s in self:
-            for o in other:
-                s.outputs.append(o)
-                o.inputs.append(s)
+        # Both sides are iterated only once (a 'Neuron' would otherwise create a new generator for every
+        # neuron on the other side). The connections are kept in dicts used as ordered sets: 'update()'
+        # adds them in the order they were made and ignores the ones that already exist (connecting twice
+        # does not duplicate them)
+        sources = dict.fromkeys(self)
+        targets = dict.fromkeys(other)
+        for s in sources:
+            s.outputs.update(targets)
+        for o in targets:
+            o.inputs.update(sources)
 
 
 # A scalar (individual) class
 class Neuron(Connectable):
+    __slots__ = ('name', 'inputs', 'outputs')
     def __init__(self, name):
         self.name = name
-        self.inputs = []  # connections from the previous layer of neurons
-        self.outputs = []  # connections to the next layer of neurons
+        self.inputs = {}  # connections from the previous layer of neurons (a dict keeps their order)
+        self.outputs = {}  # connections to the next layer of neurons
 
     # overriding the __iter__() method to define the iteration behaviour of a 'Neuron' instance
     # This method has to be implemented to allow looping over (once) the single element of an instance
@@ -162,13 +179,12 @@ class Neuron(Connectable):
 
 # A collection class
 class NeuronLayer(list, Connectable):
+    __slots__ = ('name',)  # the neurons themselves are stored by the 'list'
     def __init__(self, name, count):
-        super().__init__()
+        # Fill the layer with 'Neuron' instances with corresponding names in one go (Remember, this class
+        # inherits from the 'list' class and hence can hold multiple values in 'self')
+        super().__init__([Neuron(f'{name}-{x}') for x in range(count)])
         self.name = name
-        for x in range(0, count):
-            # Add 'Neuron' instances with corresponding names to the layer (Remember, this class inherits from
-            # the 'list' class and hence can hold multiple values in 'self')
-            self.append(Neuron(f'{name}-{x}'))
 
     def __str__(self):
         return f'{self.name} with {len(self)} neurons'
@@ -218,6 +234,7 @@ if __name__ == '__main__':
 
 
 class SingleValue:
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
     @property
@@ -227,14 +244,25 @@ class SingleValue:
         yield self.value
 
 class ManyValues(list):
+    __slots__ = ()
     def __init__(self):
         super().__init__()
     @property
     def sum(self):
+        # Nested 'ManyValues' objects are summed with a stack of iterators instead of recursive calls: numbers
+        # are added up, a nested 'ManyValues' is iterated over in its turn and any other item (like a
+        # 'SingleValue') adds its own 'sum' (an item without one raises an 'AttributeError').
         total = 0
-        for item in self:
-            if isinstance(item, int):
-                total += item
+        stack = [iter(self)]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, (int, float)):
+                    total += item
+                elif isinstance(item, ManyValues):
+                    stack.append(iter(item))
+                    break  # continue with the items of 'item', then come back to this iterator
+                else:
+                    total += item.sum
             else:
-                total += item.sum
+                stack.pop()  # this iterator is exhausted
         return total
\ No newline at end of file
@@ -56,6 +56,7 @@ def some_op():
 from abc import ABC # for creating abstract classes
 
 class Shape(ABC):
+    __slots__ = ()
     def __str__(self):
         return ''
     
@@ -78,10 +79,13 @@ class Square(Shape):
 
 # A Decorator Class - Notice that it inherits the 'Shape' class as base to work with the children of 'Shape',
 # ie, both the 'Square' and the 'Circle' classes
+# The Decorator classes use '__slots__' (no '__dict__' for every Decorator instance).
 class ColoredShape(Shape):
+    __slots__ = ('shape', 'color')
+    _is_colored = True # marks the colored shapes (other shapes do not have this attribute)
     def __init__(self, shape, color):
         # Handling nested decorations of an instance
-        if (isinstance(shape, ColoredShape)):
+        if getattr(shape, '_is_colored', False):
             raise Exception('Cannot apply same decorator twice!')
         # Using a reference of an object of the to class to be decorated instead of inheriting the class to 
         # be decorated directly. The open-closed principle is still intact here.
@@ -94,6 +98,7 @@ class ColoredShape(Shape):
 
 # Another Decorator class
 class TransparentShape(Shape):
+    __slots__ = ('shape', 'transparency')
     def __init__(self, shape, transparency):
         self.shape = shape
         self.transparency = transparency
@@ -154,14 +159,22 @@ class FileWithLogging:
         # the default value provided to the function. 
         # REMEMBER: Since the introduction of metaclasses in Python3, self.__dict__ refers to a dictionary of 
         # the writable attributes and methods of an instance (object)
-        return getattr(self.__dict__['file'], item) # This calls the __getattr__() of the underlying 'file' instance
+        value = getattr(self.__dict__['file'], item) # This calls the __getattr__() of the underlying 'file' instance
+        # Methods (like 'write') are stored in the Decorator's own self.__dict__, so that the next accesses find
+        # them through the normal mechanism and this method is not called for them anymore. Other attributes
+        # (like 'closed') can change on the underlying object, so they are looked up every time.
+        if callable(value):
+            object.__setattr__(self, item, value) # stored directly, without going through our __setattr__()
+        return value
     def __setattr__(self, key, value):
         # Since the introduction of metaclasses in Python3, self.__dict__ refers to a dictionary of 
         # attributes and methods of an instance
-        # When the 'file' attribute of this Decorator class has to be set, we set in directly using
-        # the self.__dict__ attributes dictionary of the Decorator class itself
+        # When the 'file' attribute of this Decorator class has to be set, we set it directly on the Decorator
+        # itself with object.__setattr__() (the default implementation, which stores it in self.__dict__).
+        # The methods stored by __getattr__() belong to the previous file, so they are forgotten.
         if (key == 'file'):
-            self.__dict__[key] = value
+            self.__dict__.clear()
+            object.__setattr__(self, key, value)
         else:
             # For attributes other than 'file', we use the setattr() method on the underlying object
             # of the decorator (the file instance) to invoke the file instance's __setattr__() method
@@ -170,10 +183,12 @@ class FileWithLogging:
             # The setattr(object, name, value) function sets the value of the attribute of an object by 
             # internally calling the object's __setattr__() method.
             setattr(self.__dict__['file'], key, value)
+            self.__dict__.pop(key, None) # forget the method stored by __getattr__(), if any
     def __delattr__(self, item):
         # The delattr(object, item) function an attribute of the attribute of an object by 
         # internally calling the object's __delattr__() method.
         delattr(self.__dict__['file'], item)
+        self.__dict__.pop(item, None) # forget the method stored by __getattr__(), if any
 
     # Providing access to the underlying file instance's __iter__() and __next__() for iteration of the file
     # instance at the Decorator level (works only when these methods are implemented in the file instance 
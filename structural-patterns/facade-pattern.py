@@ -14,31 +14,56 @@
 # displayed to the console screen are stored), view ports (that show only the last few lines or a chunk of the 
 # information from the buffer)
 
+from array import array
+
+_SPACE = array('I', [ord(' ')])
 
 class Buffer:
     def __init__(self, width=30, height=20):
         self.width = width
         self.height = height
-        # initialize the buffer with spaces
-        self.buffer = [' '] * (width * height)
+        # initialize the buffer with spaces. The characters are stored as their code points (4 bytes per
+        # character, so any character can be written) in a compact 'array' instead of a list of one-character
+        # strings
+        self.buffer = _SPACE * (width * height)
+        self._pos = 0 # the position where the next text is written
     # support for indexing - get a character at a particular position in the buffer
     def __getitem__(self, item):
-        # Since our self.buffer is a list of characters, we use the __getitem__() of the list instance (object)  
-        return self.buffer.__getitem__(item)
-
+        # Since our self.buffer is an array, we use the __getitem__() of the array instance (object) and
+        # turn the code point(s) back into characters
+        if isinstance(item, slice):
+            return ''.join(map(chr, self.buffer.__getitem__(item)))
+        return chr(self.buffer.__getitem__(item))
+    # get the character at a single position (a plain index, without the slice check of __getitem__())
+    def char_at(self, index):
+        return chr(self.buffer[index])
+
+    # write the text at the current position, in place. The buffer keeps its size of width * height
+    # characters: like a terminal, it scrolls when the text does not fit - the oldest characters are dropped
+    # from the front (a single move of the array in C) and the new text is written at the end.
     def write(self, text):
-        self.buffer += text
+        size = len(self.buffer)
+        data = array('I', map(ord, text[-size:])) # at most one full buffer of the text can be kept
+        overflow = self._pos + len(data) - size
+        if overflow > 0:
+            del self.buffer[:overflow]
+            self.buffer += _SPACE * overflow
+            self._pos -= overflow
+        self.buffer[self._pos:self._pos + len(data)] = data
+        self._pos += len(data)
 
 
 # Used to show a chunk of the Buffer on screen
 class ViewPort:
-    def __init__(self, buffer=Buffer()):
-        self.buffer = buffer
+    # (a default of 'buffer=Buffer()' would be created once, when the class is defined, and then shared by
+    # every ViewPort created without a buffer - so a new Buffer is created here instead)
+    def __init__(self, buffer=None):
+        self.buffer = Buffer() if buffer is None else buffer
         self.offset = 0
     # get a character at a particular index within this viewport (the 'offset' attribute takes care of getting
     # the character at the index of the chunk of the buffer that this viewport holds)
     def get_char_at(self, index):
-        return self.buffer[index+self.offset]
+        return self.buffer.char_at(index+self.offset)
     # add content to the underlying buffer through the viewport
     def append(self, text):
         self.buffer.write(text)
@@ -63,7 +88,7 @@ class Console:
     # method to get the character at a particular index within the current 'ViewPort' instance.
     # This is a high-level API that connects to the functionality of a lower-level API in the 'Buffer' instance
     def get_character_at(self, index):
-        self.current_viewport.buffer.__getitem__(index)
+        return self.current_viewport.get_char_at(index)
 
 
 if __name__ == '__main__':
@@ -88,69 +113,141 @@ if __name__ == '__main__':
 # Please implement a Façade class called 'MagicSquareGenerator'  which simply generates the magic square of a 
 # given size.
 
-from random import randint
+from random import choices
+
+_DIGITS = range(1, 10)
 
 class Generator:
+  # all the random digits of the list are drawn by a single 'choices()' call
   def generate(self, count):
-    return [randint(1,9) for x in range(count)]
+    return choices(_DIGITS, k=count)
 
 class Splitter:
+  # The rows, columns and diagonals are extracted with built-ins ('list()', 'zip()') that loop in C,
+  # instead of appending the numbers one by one
   def split(self, array):
-    result = []
-
     row_count = len(array)
     col_count = len(array[0])
 
-    for r in range(row_count):
-      the_row = []
-      for c in range(col_count):
-        the_row.append(array[r][c])
-      result.append(the_row)
-
-    for c in range(col_count):
-      the_col = []
-      for r in range(row_count):
-        the_col.append(array[r][c])
-      result.append(the_col)
+    result = [list(row) for row in array]
+    result.extend(map(list, zip(*array)))
 
-    diag1 = []
-    diag2 = []
+    # diag1 goes through the cells where c == r, diag2 through the cells where c == row_count - r - 1
+    result.append([array[c][c] for c in range(col_count) if c < row_count])
+    result.append([array[row_count - c - 1][c] for c in range(col_count) if c < row_count])
 
-    for c in range(col_count):
-      for r in range(row_count):
-        if c == r:
-          diag1.append(array[r][c])
-        r2 = row_count - r - 1
-        if c == r2:
-          diag2.append(array[r][c])
+    return result
 
-    result.append(diag1)
-    result.append(diag2)
+  # The sums of the same rows, columns and diagonals that 'split()' gives, computed in a single pass over the
+  # 2D list - without building a list for every column and diagonal
+  def sums(self, array):
+    row_count = len(array)
+    col_count = len(array[0])
 
-    return result
+    rows = [sum(row) for row in array]
+    cols = [0] * col_count
+    diag1 = diag2 = 0
+    for r in range(row_count):
+      row = array[r]
+      for c in range(col_count):
+        cols[c] += row[c]
+      if r < col_count:
+        diag1 += row[r]
+        diag2 += array[row_count - r - 1][r]
+    return rows + cols + [diag1, diag2]
 
 class Verifier:
   def verify(self, arrays):
-    first = sum(arrays[0])
+    return self.verify_sums(map(sum, arrays))
 
-    for i in range(1, len(arrays)):
-      if sum(arrays[i]) != first:
-        return False
-
-    return True
+  # the same check, for sums that were already computed (such as the ones from 'Splitter.sums()')
+  def verify_sums(self, sums):
+    sums = iter(sums)
+    first = next(sums)
+    # stops at the first sum that differs
+    return all(s == first for s in sums)
 
 class MagicSquareGenerator:
   def generate(self, size):
-    gen = Generator()
-    check = Verifier()
-    extract = Splitter()
+    generate_row = Generator().generate # the bound methods, looked up once for all the trials
+    sums = Splitter().sums
+    verify_sums = Verifier().verify_sums
     # Run a loop till a magic matrix is built
-    # use the 'Generator' instance to build rows of random numbers and add the rows to an empty list
-    # then extract the different sums to be checked for the generated magic matrix using instance of 'Splitter'
-    # Break out of the loop if the 'Verifier' instance returns 'True' for the extracted list of sub-lists
+    # use the 'Generator' instance to build rows of random numbers and add the rows to an empty list.
+    # Every row has to add up to the sum of the first row, so a matrix is abandoned as soon as a row does not
+    # (most random matrices fail here, before the whole matrix is even generated).
+    # Then use the 'Splitter' instance to get the sums of all the rows, columns and diagonals, and break out
+    # of the loop if the 'Verifier' instance finds that they all match
     while True:
-        matrix = []
-        for _ in range(size):
-            matrix.append(gen.generate(size))
-        if check.verify(extract.split(matrix)):
-            return matrix
\ No newline at end of file
+        matrix = [generate_row(size)]
+        target = sum(matrix[0])
+        for _ in range(1, size):
+            row = generate_row(size)
+            if sum(row) != target:
+                break
+            matrix.append(row)
+        else:
+            if verify_sums(sums(matrix)):
+                return matrix
+
+
+
+# TESTS
+
+import unittest
+
+class FacadeTest(unittest.TestCase):
+    def test_console(self):
+        c = Console()
+        c.write('hello')
+        self.assertEqual('h', c.get_character_at(0))
+        self.assertEqual('o', c.get_character_at(4))
+        self.assertEqual(' ', c.get_character_at(5))
+
+    def test_write_continues_at_the_current_position(self):
+        b = Buffer(5, 2)
+        b.write('abc')
+        b.write('de')
+        self.assertEqual('abcde     ', b[:])
+
+    def test_buffer_scrolls(self):
+        b = Buffer(5, 1)
+        b.write('hello')
+        b.write('ab')
+        self.assertEqual('lloab', b[:])
+        self.assertEqual(5, len(b.buffer))
+        b.write('0123456789') # only the last full buffer of a long text is kept
+        self.assertEqual('56789', b[:])
+
+    def test_any_character(self):
+        b = Buffer(5, 1)
+        b.write('h€λ😀')
+        self.assertEqual('€', b.char_at(1))
+        self.assertEqual('😀', b[3])
+        self.assertEqual('h€λ😀 ', b[:])
+
+    def test_viewport_offset(self):
+        v = ViewPort(Buffer(5, 1))
+        v.append('hello')
+        v.offset = 1
+        self.assertEqual('e', v.get_char_at(0))
+
+    def test_sums(self):
+        array = [[2, 7, 6], [9, 5, 1], [4, 3, 8]]
+        self.assertEqual([15] * 8, Splitter().sums(array))
+        self.assertTrue(Verifier().verify_sums(Splitter().sums(array)))
+
+    def test_sums_match_split(self):
+        array = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        splitter = Splitter()
+        self.assertEqual(list(map(sum, splitter.split(array))), splitter.sums(array))
+        self.assertFalse(Verifier().verify(splitter.split(array)))
+
+    def test_magic_square(self):
+        square = MagicSquareGenerator().generate(3)
+        self.assertEqual(3, len(square))
+        self.assertTrue(Verifier().verify(Splitter().split(square)))
+
+
+if __name__ == '__main__':
+    unittest.main()
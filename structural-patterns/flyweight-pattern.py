@@ -11,13 +11,26 @@
 
 import string
 import random
+import sys
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
+
+_CHARS = string.ascii_lowercase
 
 # A function to generate a random 8 character string to be used as a name
+# ('random.choices()' picks all 8 characters in a single call)
 def random_string():
-    chars = string.ascii_lowercase
-    return ''.join([random.choice(chars) for _ in range(8)])
+    return ''.join(random.choices(_CHARS, k=8))
+
+# A function to generate 'n' random names of 'k' characters at once - all the characters of all the names are
+# picked in a single call and the resulting string is then cut into names
+def many_random_strings(n, k=8):
+    chars = ''.join(random.choices(_CHARS, k=n * k))
+    return [chars[i:i + k] for i in range(0, n * k, k)]
 
 class User:
+    __slots__ = ('name',) # no per-instance '__dict__' - matters when there are thousands of users
     def __init__(self, name):
         self.name = name
 
@@ -25,6 +38,8 @@ class User:
 class User2:
     strings = [] # A static attribute (class variable) that stores all unique first and last names encountered
     # by the instances of this class during initantiation
+    _index = {} # the index of every name within 'strings' (a dictionary lookup instead of searching the list)
+    __slots__ = ('names',) # the only per-instance attribute ('strings' and '_index' stay class attributes)
     def __init__(self, full_name):
         # split the whole name into the first name and last name parts and simply store the indices of
         # the first name and last name into the
@@ -32,21 +47,30 @@ class User2:
             # return the index of a string 's' within 'self.strings' which is a list of all the unique
             # first and last names. When 's' is not present in 'self.strings', add 's' 'self.strings' and
             # return the last index position in 'self.strings'
-            if s in self.strings:
-                return self.strings.index(s)
-            else:
-                self.strings.append(s)
-                return len(self.strings) - 1
-        self.names = [get_or_add(x) for x in full_name.split(' ')]
+            index = User2._index.get(s)
+            if index is None:
+                s = sys.intern(s) # the stored name is also shared with any other identical interned string
+                index = len(User2.strings)
+                User2.strings.append(s)
+                User2._index[s] = index
+            return index
+        # the indices are packed into an array of unsigned integers instead of a list of separate int objects:
+        # 16-bit integers (2 bytes each) for as long as there are at most 65536 unique names (like in the
+        # example below), 32-bit ones once there are more
+        indices = [get_or_add(x) for x in full_name.split(' ')]
+        self.names = array('H' if len(User2.strings) <= 65536 else 'I', indices)
     
     # string representation of the user's name
+    # ('itemgetter' gets all the names of the user out of 'strings' in a single call)
     def __str__(self):
-        return ' '.join([self.strings[x] for x in self.names])
+        if len(self.names) == 1: # with a single index, 'itemgetter' returns the name itself (not a tuple)
+            return self.strings[self.names[0]]
+        return ' '.join(itemgetter(*self.names)(self.strings))
 
 # if __name__ == '__main__':
 #     users = []
-#     first_names = [random_string() for _ in range(100)]
-#     last_names = [random_string() for _ in range(100)]
+#     first_names = many_random_strings(100)
+#     last_names = many_random_strings(100)
     # create cartesian product of first and last names and append to the 'users' list
     # Here, there are only 100 unique first names and 100 unique last names that produce 10,000 name 
     # combinations. This is where we can apply the Flyweight Pattern to reduce memory usage!
@@ -70,21 +94,35 @@ class FormattedText:
         self.plain_text = plain_text
         # Brute force approach - use a Boolean Array of the same length of the input text to mark characters
         # that have to be formatted a particular way (capitalized or bold or italicized)
-        # This creates a Boolean Array just as long as the input string!
-        self.caps = [False] * len(plain_text)
+        # This Boolean Array is just as long as the input string! It is stored as the bits of a single integer
+        # (bit i is set when the character i is capitalized) - one bit per character instead of one list item.
+        self.caps = 0
     
-    # method to set the values in the boolean array to True for characters which require capitalization
+    # method to set the bits of the boolean array to True for characters which require capitalization
+    # (the characters from 'start - 1' to 'end' are all set at once with a mask of 'end - low + 1' bits; the
+    # range is clamped to the start of the text, as a shift by a negative count is an error)
     def capitalize(self, start, end):
-        for i in range(start - 1, end + 1):
-            self.caps[i] = True
+        low = max(start - 1, 0)
+        if end >= low:
+            self.caps |= ((1 << (end - low + 1)) - 1) << low
 
     # string representation of the formatted text
     def __str__(self):
+        # Instead of checking every character, find the runs of successive capitalized characters in the
+        # bits of 'caps' and capitalize each run as a whole slice of the text
+        text = self.plain_text
         result = []
-        for i in range(len(self.plain_text)):
-            c = self.plain_text[i] # each individual character of the 'plain_text' string
-            # capitalization is done for characters that require it by checking the Boolean Array 'caps'
-            result.append(c.upper() if self.caps[i] else c)
+        pos = 0 # the characters before 'pos' have already been added to the result
+        rest = self.caps >> pos
+        while rest:
+            start = pos + (rest & -rest).bit_length() - 1 # the lowest set bit is the start of the next run
+            run = self.caps >> start
+            end = start + (run ^ (run + 1)).bit_length() - 1 # skip all the successive set bits of the run
+            result.append(text[pos:start])
+            result.append(text[start:end].upper())
+            pos = end
+            rest = self.caps >> pos
+        result.append(text[pos:])
         return ''.join(result)
 
 # A class implementing the Flyweight pattern to save up space
@@ -95,46 +133,100 @@ class BetterFormattedText:
         # which specify the indices of characters within the text that need particular formatting 
         # (bold, italicized, capitalized etc.)
         self.formatting = []
+        # The capitalized characters are also kept "run-length encoded": a sorted list of disjoint [start, end]
+        # runs. Overlapping or adjacent capitalized ranges are merged into a single run, so the same characters
+        # are never covered twice no matter how many ranges are capitalized.
+        self._caps_rle = []
     
     # An inner class (a class inside another class) that gives the blueprint for a formatting range object
     class TextRange:
         # The text range will contain a start index, end index and a boolean value indicating whether
-        # to capitalize or not
-        def __init__(self, start, end, capitalize = False):
+        # to capitalize or not. It also keeps the 'BetterFormattedText' instance that it belongs to (if any),
+        # so that capitalizing the range can update the capitalized runs of that text.
+        __slots__ = ('start', 'end', 'text', '_capitalize')
+        def __init__(self, start, end, capitalize = False, text = None):
             self.start = start
             self.end = end
+            self.text = text
+            self._capitalize = False
             self.capitalize = capitalize
         # method to check if a particular position in the text string is covered by this formatting range
         def covers(self, position):
             return self.start <= position <= self.end
+
+        @property
+        def capitalize(self):
+            return self._capitalize
+
+        # Changing the format specifier of the range updates the capitalized runs of the text
+        @capitalize.setter
+        def capitalize(self, value):
+            value = bool(value)
+            if value == self._capitalize:
+                return
+            self._capitalize = value
+            if self.text is None:
+                return
+            if value: # merge this range into the existing runs
+                self.text._add_caps(self.start, self.end)
+            else: # a run may be shared by several ranges, so build the runs again from the remaining ones
+                self.text._rebuild_caps()
     
     # method of the 'BetterFromattedText' class for creating a 'TextRange' instance out of the given
     # start and end index and set the default format of text in this range to be un-capitalized in 
     # 'self.plain_text'. Then, this range is 
     def get_range(self, start, end):
         # use 'self.TextRange()' to instantiate the 'TextRange' class with the 'start' and 'end' arguments
-        range = self.TextRange(start - 1, end + 1)  
+        range = self.TextRange(start - 1, end + 1, text=self)  
         # push the 'TextRange' instance into the list of text string index ranges that require formatting
         self.formatting.append(range)
         return range # The created 'TextRange' instance is also returned here. This is a reference to the
         # instance in 'self.formatting' and can be used to manipulate the format specifier 'self.capitalize'
         # of this 'TextRange' instance
+
+    # method to insert the characters from 'start' to 'end' (both included) into the capitalized runs.
+    # 'bisect' finds where the new run goes, and the runs that overlap or touch it are merged into it.
+    def _add_caps(self, start, end):
+        start = max(start, 0)
+        if end < start:
+            return
+        runs = self._caps_rle
+        i = bisect_left(runs, [start])
+        if i and runs[i - 1][1] + 1 >= start: # the previous run reaches (or touches) the new one
+            i -= 1
+            start = runs[i][0]
+        j = i
+        while j < len(runs) and runs[j][0] <= end + 1: # swallow every following run that starts in time
+            end = max(end, runs[j][1])
+            j += 1
+        runs[i:j] = [[start, end]]
+
+    # method to build the capitalized runs again from all the capitalized ranges
+    def _rebuild_caps(self):
+        self._caps_rle = []
+        for r in self.formatting:
+            if r.capitalize:
+                self._add_caps(r.start, r.end)
     
     # string representation of the text with included formatting
+    # Instead of checking every character against every range, the text is cut at the (already merged)
+    # capitalized runs: the text between two runs is added as it is and every run is added capitalized.
+    # The number of pieces is known in advance (the text before every run, every run and the text after the
+    # last run), so the list of pieces is allocated once with its final size and filled in by index.
     def __str__(self):
-        result = []
-        for i in range(len(self.plain_text)): # loop through every character in the text string
-            c = self.plain_text[i]
-            for r in self.formatting: # For every 'TextRange' instance in 'self.formatting'
-                # if the 'TextRange' instance includes the position 'i' from 'self.plain_text' and the
-                # range object specifies the font to be capitalized
-                if r.covers(i) and r.capitalize:
-                    c = c.upper()
-                result.append(c) # append either the uppercase or normal string character as you loop through
-                # the text string
+        text = self.plain_text
+        runs = self._caps_rle
+        result = [''] * (2 * len(runs) + 1)
+        i = 0 # the characters before 'i' have already been added to the result
+        k = 0 # the next piece of the result to fill in
+        for start, end in runs:
+            result[k] = text[i:start]
+            result[k + 1] = text[start:end + 1].upper()
+            k += 2
+            i = end + 1
+        result[k] = text[i:]
         return ''.join(result)
 
-
 if __name__ == '__main__':
     text = 'This is a brave new world'
     ft = FormattedText(text)
@@ -157,25 +249,113 @@ if __name__ == '__main__':
 
 class Sentence:
     class WordToken:
+        __slots__ = ('capitalize',) # one token per word, so no '__dict__' for each of them
         def __init__(self, capitalize=False):
             self.capitalize = capitalize
 
     def __init__(self, plain_text):
-        self.words = plain_text.split(' ')
-        self.tokens = [self.WordToken() for w in self.words]
-    # method to get out the 'WordToken' instance at the given index in 'self.tokens'
+        self.words = tuple(plain_text.split(' '))
+        # the capitalized version of every word is made only once, instead of on every call of '__str__()'
+        self._upper = tuple(w.upper() for w in self.words)
+        # No 'WordToken' is created until a word is actually asked for: 'None' stands for a word that was
+        # never indexed (and so cannot be capitalized)
+        self.tokens = [None] * len(self.words)
+    # method to get out the 'WordToken' instance at the given index in 'self.tokens' (or a list of them for a
+    # slice), creating the ones that do not exist yet
     def __getitem__(self, item):
-        return self.tokens[item]
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self.tokens)))]
+        token = self.tokens[item] # raises an 'IndexError' for a word that does not exist, just like the list
+        if token is None:
+            token = self.tokens[item] = self.WordToken()
+        return token
     def __str__(self):
-        result = []
-        for i in range(len(self.words)):
-            w = self.words[i]
-            if self.tokens[i].capitalize:
-                w = w.upper()
-            result.append(w)
-        return ' '.join(result)
+        # every word is paired with its token, and capitalized if the token says so
+        return ' '.join([u if t is not None and t.capitalize else w
+                         for w, u, t in zip(self.words, self._upper, self.tokens)])
     
 
 s = Sentence('alpha beta gamma')
 s[1].capitalize = True
-print(s)
\ No newline at end of file
+print(s)
+
+
+# TESTS
+
+import unittest
+
+class FlyweightTest(unittest.TestCase):
+    def test_formatted_text(self):
+        ft = FormattedText('This is a brave new world')
+        ft.capitalize(11, 15)
+        self.assertEqual('This is a BRAVE new world', str(ft))
+
+    def test_formatted_text_from_the_start(self):
+        # a range that starts at the first character must not shift the bits by a negative count
+        ft = FormattedText('This is a brave new world')
+        ft.capitalize(0, 3)
+        self.assertEqual('THIS is a brave new world', str(ft))
+
+    def test_better_formatted_text(self):
+        bft = BetterFormattedText('This is a brave new world')
+        bft.get_range(17, 19).capitalize = True
+        self.assertEqual('This is a brave NEW World', str(bft))
+
+    def test_overlapping_ranges_are_merged(self):
+        bft = BetterFormattedText('This is a brave new world')
+        first = bft.get_range(1, 3)
+        second = bft.get_range(3, 6)
+        first.capitalize = True
+        second.capitalize = True
+        self.assertEqual([[0, 7]], bft._caps_rle)
+        self.assertEqual('THIS IS a brave new world', str(bft))
+        # the characters of the first range that the second one still covers stay capitalized
+        first.capitalize = False
+        self.assertEqual([[2, 7]], bft._caps_rle)
+        self.assertEqual('ThIS IS a brave new world', str(bft))
+
+    def test_sentence(self):
+        s = Sentence('alpha beta gamma')
+        s[1].capitalize = True
+        self.assertEqual('alpha BETA gamma', str(s))
+        self.assertIs(s[1], s[1]) # the same token every time
+        self.assertIsNone(s.tokens[2]) # no token for a word that was never indexed
+
+    def test_sentence_slice(self):
+        s = Sentence('alpha beta gamma')
+        for token in s[1:]:
+            token.capitalize = True
+        self.assertEqual('alpha BETA GAMMA', str(s))
+
+    def test_sentence_index_error(self):
+        s = Sentence('alpha beta gamma')
+        with self.assertRaises(IndexError):
+            s[3]
+
+    # 'User2' keeps its names in class attributes, so every test starts with empty ones and puts the
+    # original ones back afterwards
+    def setUp(self):
+        self.strings, self.index = User2.strings, User2._index
+        User2.strings, User2._index = [], {}
+
+    def tearDown(self):
+        User2.strings, User2._index = self.strings, self.index
+
+    def test_user_names_are_shared(self):
+        u1 = User2('John Smith')
+        u2 = User2('Jane Smith')
+        self.assertEqual('John Smith', str(u1))
+        self.assertEqual('Jane Smith', str(u2))
+        self.assertEqual(['John', 'Smith', 'Jane'], User2.strings)
+        self.assertEqual('H', u1.names.typecode)
+
+    def test_user_names_widen_past_16_bits(self):
+        User2.strings = [str(i) for i in range(65536)]
+        User2._index = {s: i for i, s in enumerate(User2.strings)}
+        u = User2('John Smith')
+        self.assertEqual('I', u.names.typecode)
+        self.assertEqual('John Smith', str(u))
+
+
+if __name__ == '__main__':
+    unittest.main()
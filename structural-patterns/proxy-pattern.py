@@ -82,8 +82,11 @@ class LazyBitMap:
 
     def draw(self):
         # Lazy Laoading - Load the image file only when the draw() method is actually called!
-        if not self._bitmap:
-            self._bitmap = BitMap(self.filename)
+        # This method only runs for the first call: it loads the image and then replaces itself (on this
+        # instance) with the 'draw()' method of the loaded image, so every later call goes straight to
+        # the image without checking whether it has been loaded
+        self._bitmap = BitMap(self.filename)
+        self.draw = self._bitmap.draw
         self._bitmap.draw()
 
 # A function to draw a given 'BitMap' instance
@@ -148,13 +151,15 @@ class ResponsiblePerson:
         self._person.age = value
 
     def drink(self):
-        if self.age < 18:
+        # the age is read straight from the person (skipping the 'age' property of the Proxy), so the
+        # Proxy always reflects the current age of the person
+        if self._person.age < 18:
             return 'too young'
         else:
             self._person.drink()
     
     def drive(self):
-        if self.age < 16:
+        if self._person.age < 16:
             return 'too young'
         else:
             self._person.drive()